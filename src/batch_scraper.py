@@ -1,29 +1,73 @@
 """Batch scraper for all NCAA tennis programs."""
 
 import asyncio
-import csv
-import json
+import importlib.util
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
+from typing import Iterable
+from urllib.parse import urlparse
 
 from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
 from rich.table import Table
 
-from .models import Division, Gender, TennisProgram
+from .exporters import CsvWriter, JsonArrayWriter, JsonlWriter, ProgramWriter, export_programs
+from .incremental import build_delta, display_delta, export_delta, latest_export, load_previous
+from .journal import CheckpointJournal
+from .models import Division, Gender, ProgramRecord
+from .resource_filter import BLOCK_NOTHING, BlockConfig
 from .scraper import TennisScraper
 from .schools_data import get_all_schools
+from .store import ProgramStore
 
 
 console = Console()
 
+PARQUET_MISSING = "Parquet export needs pyarrow: pip install 'tennis-crawler[parquet]'"
+
+
+def parquet_available() -> bool:
+    """Whether the optional pyarrow dependency (the "parquet" extra) is installed."""
+    return importlib.util.find_spec("pyarrow") is not None
+
 
 async def scrape_all_programs(
     limit: int | None = None,
-    resume_from: int = 0,
+    resume: bool = False,
     output_dir: Path = Path("data"),
+    workers: int = 8,
+    per_host: int = 2,
+    incremental: bool = False,
+    jsonl: bool = False,
+    parquet: bool = False,
+    store: Path | None = Path("data/programs.sqlite"),
+    block_resources: bool = True,
 ):
-    """Scrape all NCAA tennis programs."""
+    """Scrape all NCAA tennis programs.
+
+    Programs are scraped concurrently: at most ``workers`` programs are in flight
+    at once, and at most ``per_host`` of them may target the same athletics host.
+
+    Every completed program or error is appended to a checkpoint journal. With
+    ``resume`` the journal is replayed and only programs without a result are
+    scraped (earlier errors are retried). Records of schools outside this run
+    stay in the journal but aren't exported, so exports cover exactly the
+    schools of this run.
+
+    With ``incremental`` the latest export in ``output_dir`` is the baseline:
+    coach pages whose fingerprint is unchanged reuse its coaches, and a
+    changes-only report is written next to the new export.
+
+    Each completed program is also upserted into the SQLite ``store``.
+
+    Without ``block_resources`` pages load every subresource but traffic and
+    load time are still accounted, to compare against a blocking run.
+    """
+    # Fail before scraping rather than when the export opens its writers
+    if parquet and not parquet_available():
+        raise RuntimeError(PARQUET_MISSING)
+
     output_dir.mkdir(exist_ok=True)
 
     schools = get_all_schools()
@@ -31,107 +75,182 @@ async def scrape_all_programs(
         schools = schools[:limit]
 
     total_tasks = len(schools) * 2  # Men and Women for each school
-    programs: list[TennisProgram] = []
     errors: list[dict] = []
 
     # Load existing results if resuming
-    results_file = output_dir / "all_programs_progress.json"
-    if resume_from > 0 and results_file.exists():
-        with open(results_file) as f:
-            saved = json.load(f)
-            programs = [TennisProgram(**p) for p in saved.get("programs", [])]
-            errors = saved.get("errors", [])
-        console.print(f"[yellow]Resuming from school {resume_from}, loaded {len(programs)} existing programs[/yellow]")
+    journal = CheckpointJournal(output_dir / "all_programs_progress.jsonl")
+    done: dict[tuple[str, Gender], ProgramRecord] = {}
+    failed: dict[tuple[str, Gender], dict] = {}
+    if resume:
+        done, failed = journal.load()
+        console.print(f"[yellow]Resuming, loaded {len(done)} existing programs[/yellow]")
+    journal.open(truncate=not resume)
+    program_store = ProgramStore(store) if store else None
+
+    baseline = latest_export(output_dir) if incremental else None
+    previous = load_previous(baseline) if baseline else {}
+    if incremental:
+        if baseline:
+            console.print(f"[yellow]Incremental run against {baseline.name} ({len(previous)} programs)[/yellow]")
+        else:
+            console.print("[yellow]No previous export found, scraping everything[/yellow]")
 
     console.print(f"[bold]Scraping {len(schools)} schools ({total_tasks} programs)[/bold]\n")
 
-    async with TennisScraper(rate_limit=1.0) as scraper:
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[progress.description]{task.description}"),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console,
-        ) as progress:
-            task = progress.add_task("Scraping...", total=len(schools) - resume_from)
-
-            for i, school in enumerate(schools[resume_from:], start=resume_from):
-                progress.update(task, description=f"[cyan]{school['school']}[/cyan]")
-
-                for gender in [Gender.MEN, Gender.WOMEN]:
-                    try:
-                        program = await scraper.scrape_program(
-                            university=school["school"],
-                            state=school["state"],
-                            athletics_url=school["athletics_url"],
-                            division=school["division"],
-                            gender=gender,
-                        )
-                        programs.append(program)
-
-                        if program.head_coach:
-                            console.print(f"  ✓ {gender.value}: {program.head_coach.name}")
-                        else:
-                            console.print(f"  ⚠ {gender.value}: No coach found")
-
-                    except Exception as e:
-                        errors.append({
-                            "school": school["school"],
-                            "gender": gender.value,
-                            "error": str(e),
-                        })
-                        console.print(f"  ✗ {gender.value}: {e}")
-
-                progress.advance(task)
-
-                # Save progress every 10 schools
-                if (i + 1) % 10 == 0:
-                    save_progress(programs, errors, output_dir)
-                    console.print(f"[dim]Progress saved ({i + 1}/{len(schools)} schools)[/dim]")
-
-    # Final save
-    save_progress(programs, errors, output_dir)
+    # Results are keyed by (school index, gender) so exports keep school order
+    # even though tasks finish out of order.
+    results: dict[tuple[int, Gender], ProgramRecord] = {}
+    genders = [Gender.MEN, Gender.WOMEN]
+    pending: list[tuple[int, dict, Gender]] = []
+    for i, school in enumerate(schools):
+        for gender in genders:
+            # Earlier errors of programs in this run are retried
+            failed.pop((school["school"], gender), None)
+            program = done.pop((school["school"], gender), None)
+            if program is not None:
+                results[(i, gender)] = program
+            else:
+                pending.append((i, school, gender))
+    # Journal entries for schools outside this run (e.g. beyond --limit) are
+    # kept in the journal, but only this run's schools are exported
+    carried = list(done.values())
+    carried_errors = list(failed.values())
+
+    remaining: dict[int, int] = defaultdict(int)
+    for i, _, _ in pending:
+        remaining[i] += 1
+
+    def ordered_programs() -> list[ProgramRecord]:
+        return [results[key] for key in sorted(results, key=lambda k: (k[0], k[1] != Gender.MEN))]
+
+    global_slots = asyncio.Semaphore(workers)
+    host_slots: dict[str, asyncio.Semaphore] = defaultdict(lambda: asyncio.Semaphore(per_host))
+
+    try:
+        async with TennisScraper(
+            rate_limit=1.0,
+            pool_size=workers,
+            block_resources=BlockConfig() if block_resources else BLOCK_NOTHING,
+        ) as scraper:
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[progress.description]{task.description}"),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=console,
+            ) as progress:
+                task = progress.add_task("Scraping...", total=len(remaining))
+
+                async def scrape_one(i: int, school: dict, gender: Gender):
+                    host = urlparse(school["athletics_url"]).netloc.lower()
+
+                    # Take the host slot first so a busy host doesn't hold global workers idle
+                    async with host_slots[host], global_slots:
+                        try:
+                            program = await scraper.scrape_program(
+                                university=school["school"],
+                                state=school["state"],
+                                athletics_url=school["athletics_url"],
+                                division=school["division"],
+                                gender=gender,
+                                previous=previous.get((school["school"], gender)),
+                            )
+                            results[(i, gender)] = program
+                            journal.append_program(program)
+                            if program_store:
+                                program_store.upsert(program)
+
+                            if program.head_coach:
+                                console.print(f"  ✓ {school['school']} {gender.value}: {program.head_coach.name}")
+                            else:
+                                console.print(f"  ⚠ {school['school']} {gender.value}: No coach found")
+
+                        except Exception as e:
+                            error = {
+                                "school": school["school"],
+                                "gender": gender.value,
+                                "error": str(e),
+                            }
+                            errors.append(error)
+                            journal.append_error(error)
+                            console.print(f"  ✗ {school['school']} {gender.value}: {e}")
+
+                    remaining[i] -= 1
+                    if remaining[i]:
+                        return
+
+                    # Both genders done for this school
+                    progress.update(task, description=f"[cyan]{school['school']}[/cyan]")
+                    progress.advance(task)
+
+                await asyncio.gather(*(scrape_one(i, school, gender) for i, school, gender in pending))
+
+            traffic = scraper.resource_filter.totals() if scraper.resource_filter else None
+            unchanged_pages = scraper.unchanged_pages
+            tier_counts = scraper.tier_counts
+            coalesced = scraper.flights.hits
+    finally:
+        journal.close()
+        if program_store:
+            program_store.close()
+
+    programs = ordered_programs()
+
+    # Final save: one record per program, including those carried over
+    journal.compact(programs + carried, errors + carried_errors)
 
     # Export final results
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    export_results(programs, output_dir, timestamp)
+    export_results(programs, output_dir, timestamp, jsonl=jsonl, parquet=parquet)
 
     # Summary
-    display_summary(programs, errors)
+    display_summary(programs, errors, traffic)
+    console.print(
+        f"[dim]Coach pages: {tier_counts['static']} static, {tier_counts['browser']} rendered; "
+        f"{coalesced} duplicate fetches/parses shared[/dim]"
+    )
+
+    if baseline:
+        console.print(f"[dim]{unchanged_pages} coach pages unchanged since {baseline.name}[/dim]")
+        delta = build_delta(previous, programs)
+        export_delta(delta, baseline, output_dir, timestamp)
+        if delta:
+            display_delta(delta)
 
     return programs
 
 
-def save_progress(programs: list[TennisProgram], errors: list[dict], output_dir: Path):
-    """Save progress to JSON for resume capability."""
-    with open(output_dir / "all_programs_progress.json", "w") as f:
-        json.dump({
-            "programs": [p.model_dump(mode="json") for p in programs],
-            "errors": errors,
-            "timestamp": datetime.now().isoformat(),
-        }, f, indent=2, default=str)
-
-
-def export_results(programs: list[TennisProgram], output_dir: Path, timestamp: str):
-    """Export results to JSON and CSV."""
-    # JSON
+def export_results(
+    programs: Iterable[ProgramRecord],
+    output_dir: Path,
+    timestamp: str,
+    jsonl: bool = False,
+    parquet: bool = False,
+):
+    """Export results to JSON and CSV (optionally JSON Lines and Parquet), streaming each program."""
     json_path = output_dir / f"all_tennis_programs_{timestamp}.json"
-    with open(json_path, "w") as f:
-        json.dump([p.model_dump(mode="json") for p in programs], f, indent=2, default=str)
-    console.print(f"[green]Exported {len(programs)} programs to {json_path}[/green]")
-
-    # CSV
     csv_path = output_dir / f"all_tennis_programs_{timestamp}.csv"
-    if programs:
-        rows = [p.to_flat_dict() for p in programs]
-        with open(csv_path, "w", newline="") as f:
-            writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-            writer.writeheader()
-            writer.writerows(rows)
-        console.print(f"[green]Exported {len(programs)} programs to {csv_path}[/green]")
-
-
-def display_summary(programs: list[TennisProgram], errors: list[dict]):
+    writers: list[ProgramWriter] = []
+    if parquet:
+        # pyarrow is an optional dependency (the "parquet" extra). Built first
+        # so a failed import doesn't leave the other exports half-written.
+        from .columnar import ParquetWriter
+
+        writers.append(ParquetWriter(
+            output_dir / f"all_tennis_programs_{timestamp}.parquet",
+            output_dir / f"all_tennis_coaches_{timestamp}.parquet",
+        ))
+    writers += [JsonArrayWriter(json_path), CsvWriter(csv_path)]
+    if jsonl:
+        writers.append(JsonlWriter(output_dir / f"all_tennis_programs_{timestamp}.jsonl"))
+
+    export_programs(programs, writers)
+    for writer in writers:
+        if writer.count:
+            console.print(f"[green]Exported {writer.count} programs to {writer.path}[/green]")
+
+
+def display_summary(programs: list[ProgramRecord], errors: list[dict], traffic: dict | None = None):
     """Display scraping summary."""
     table = Table(title="Scraping Summary")
     table.add_column("Metric", style="cyan")
@@ -147,6 +266,15 @@ def display_summary(programs: list[TennisProgram], errors: list[dict]):
     table.add_row("With email", f"{with_email} ({100*with_email//total if total else 0}%)")
     table.add_row("With phone", f"{with_phone} ({100*with_phone//total if total else 0}%)")
     table.add_row("Errors", str(len(errors)))
+    if traffic:
+        table.add_row("Pages rendered", str(traffic["pages"]))
+        table.add_row("Bytes downloaded", f"{traffic['bytes'] / 1_000_000:.1f} MB")
+        table.add_row("Requests blocked", f"{traffic['blocked']} of {traffic['requests'] + traffic['blocked']}")
+        if traffic["pages"]:
+            table.add_row(
+                "Page load time",
+                f"{traffic['seconds']:.1f}s ({traffic['seconds'] / traffic['pages']:.2f}s per page)",
+            )
 
     console.print("\n")
     console.print(table)
@@ -158,10 +286,46 @@ async def main():
 
     parser = argparse.ArgumentParser(description="Scrape NCAA tennis programs")
     parser.add_argument("--limit", type=int, help="Limit number of schools to scrape")
-    parser.add_argument("--resume", type=int, default=0, help="Resume from school index")
+    parser.add_argument(
+        "--resume",
+        action="store_true",
+        help="Resume from the checkpoint journal, skipping programs already scraped",
+    )
+    parser.add_argument("--workers", type=int, default=8, help="Max programs scraped concurrently")
+    parser.add_argument("--per-host", type=int, default=2, help="Max concurrent programs per athletics host")
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse coaches from the last export where the coaches page is unchanged and report changes",
+    )
+    parser.add_argument("--jsonl", action="store_true", help="Also export JSON Lines")
+    parser.add_argument(
+        "--parquet",
+        action="store_true",
+        help="Also export Parquet programs and coaches tables (needs the parquet extra)",
+    )
+    parser.add_argument("--store", type=Path, default=Path("data/programs.sqlite"), help="SQLite program store")
+    parser.add_argument("--no-store", action="store_true", help="Don't write to the program store")
+    parser.add_argument(
+        "--no-block",
+        action="store_true",
+        help="Load every subresource (still accounted) to measure what blocking saves",
+    )
     args = parser.parse_args()
-
-    await scrape_all_programs(limit=args.limit, resume_from=args.resume)
+    if args.parquet and not parquet_available():
+        parser.error(PARQUET_MISSING)
+
+    await scrape_all_programs(
+        limit=args.limit,
+        resume=args.resume,
+        workers=args.workers,
+        per_host=args.per_host,
+        incremental=args.incremental,
+        jsonl=args.jsonl,
+        parquet=args.parquet,
+        store=None if args.no_store else args.store,
+        block_resources=not args.no_block,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,170 @@
+"""Pool of reusable Playwright browser contexts and pages."""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+
+from playwright.async_api import Browser, BrowserContext, BrowserType, Page
+
+
+@dataclass
+class PooledPage:
+    """A page checked in and out of the pool, with its usage counters."""
+
+    page: Page
+    context: BrowserContext
+    navigations: int = 0
+    crashed: bool = False
+
+
+class PagePool:
+    """Bounded pool of browser pages spread over a few browser contexts.
+
+    At most ``size`` pages exist at once, packed ``pages_per_context`` to a
+    context. Pages are reused across scrapes and recycled after
+    ``max_navigations`` main-frame navigations. Crashed or closed pages are
+    discarded on check-in or check-out. If Chromium itself dies, the browser
+    is relaunched and the pool starts over.
+
+    ``on_new_page`` is awaited for every freshly created page, e.g. to install
+    request interception.
+    """
+
+    def __init__(
+        self,
+        browser_type: BrowserType,
+        size: int = 8,
+        pages_per_context: int = 4,
+        max_navigations: int = 50,
+        headless: bool = True,
+        on_new_page: Callable[[Page], Awaitable[None]] | None = None,
+    ):
+        self.browser_type = browser_type
+        self.size = size
+        self.pages_per_context = pages_per_context
+        self.max_navigations = max_navigations
+        self.headless = headless
+        self.on_new_page = on_new_page
+
+        self.browser: Browser | None = None
+        self.idle: list[PooledPage] = []
+        self.context_pages: dict[BrowserContext, int] = {}
+        self.slots = asyncio.Semaphore(size)
+        self.lock = asyncio.Lock()
+
+    async def start(self):
+        self.browser = await self.browser_type.launch(headless=self.headless)
+
+    async def close(self):
+        for context in list(self.context_pages):
+            try:
+                await context.close()
+            except Exception:
+                pass
+        self.context_pages.clear()
+        self.idle.clear()
+        if self.browser:
+            try:
+                await self.browser.close()
+            except Exception:
+                pass
+            self.browser = None
+
+    async def ensure_browser(self):
+        """Relaunch Chromium if it crashed or was disconnected."""
+        if self.browser and self.browser.is_connected():
+            return
+        print("  Browser disconnected, relaunching")
+        # Contexts and pages died with the old browser
+        self.context_pages.clear()
+        self.idle.clear()
+        await self.start()
+
+    def healthy(self, pooled: PooledPage) -> bool:
+        return (
+            not pooled.crashed
+            and not pooled.page.is_closed()
+            and pooled.navigations < self.max_navigations
+            and self.browser is not None
+            and self.browser.is_connected()
+        )
+
+    async def create_page(self) -> PooledPage:
+        context = next(
+            (c for c, n in self.context_pages.items() if n < self.pages_per_context),
+            None,
+        )
+        if context is None:
+            context = await self.browser.new_context()
+            self.context_pages[context] = 0
+
+        page = await context.new_page()
+        self.context_pages[context] += 1
+        pooled = PooledPage(page=page, context=context)
+
+        def on_navigated(frame):
+            if frame == page.main_frame:
+                pooled.navigations += 1
+
+        def on_crash(_):
+            pooled.crashed = True
+
+        page.on("framenavigated", on_navigated)
+        page.on("crash", on_crash)
+        if self.on_new_page:
+            await self.on_new_page(page)
+        return pooled
+
+    async def discard(self, pooled: PooledPage):
+        """Close a page and its context once the context holds no more pages."""
+        try:
+            await pooled.page.close()
+        except Exception:
+            pass
+
+        remaining = self.context_pages.get(pooled.context)
+        if remaining is None:
+            return
+        if remaining <= 1:
+            del self.context_pages[pooled.context]
+            try:
+                await pooled.context.close()
+            except Exception:
+                pass
+        else:
+            self.context_pages[pooled.context] = remaining - 1
+
+    async def acquire(self) -> PooledPage:
+        await self.slots.acquire()
+        try:
+            async with self.lock:
+                await self.ensure_browser()
+                while self.idle:
+                    pooled = self.idle.pop()
+                    if self.healthy(pooled):
+                        return pooled
+                    await self.discard(pooled)
+                return await self.create_page()
+        except Exception:
+            self.slots.release()
+            raise
+
+    async def release(self, pooled: PooledPage):
+        try:
+            async with self.lock:
+                if self.healthy(pooled):
+                    self.idle.append(pooled)
+                else:
+                    await self.discard(pooled)
+        finally:
+            self.slots.release()
+
+    @asynccontextmanager
+    async def page(self):
+        """Check out a page for the duration of the block."""
+        pooled = await self.acquire()
+        try:
+            yield pooled.page
+        finally:
+            await self.release(pooled)
@@ -0,0 +1,118 @@
+"""Columnar Parquet export: a programs table and a normalized coaches table."""
+
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from .exporters import ProgramWriter
+from .models import TennisProgram
+
+
+# Low-cardinality strings are dictionary-encoded; (university, gender) is the
+# program key shared by both tables.
+KEY = pa.dictionary(pa.int32(), pa.string())
+
+PROGRAMS_SCHEMA = pa.schema([
+    ("university", KEY),
+    ("gender", KEY),
+    ("state", KEY),
+    ("division", KEY),
+    ("team_name", KEY),
+    ("head_coach_name", pa.string()),
+    ("head_coach_email", pa.string()),
+    ("head_coach_phone", pa.string()),
+    ("assistant_count", pa.int16()),
+    ("athletics_url", pa.string()),
+    ("tennis_page_url", pa.string()),
+    ("coaches_fingerprint", pa.string()),
+    ("scraped_at", pa.timestamp("us")),
+])
+
+COACHES_SCHEMA = pa.schema([
+    ("university", KEY),
+    ("gender", KEY),
+    ("role", KEY),
+    # Order within the program: 0 is the head coach when there is one
+    ("position", pa.int16()),
+    ("name", pa.string()),
+    ("title", pa.string()),
+    ("email", pa.string()),
+    ("phone", pa.string()),
+])
+
+
+class ParquetWriter(ProgramWriter):
+    """Write programs and their coaches to two compressed Parquet files.
+
+    Rows are buffered per column and flushed as a row group every
+    ``batch_size`` programs, so memory stays bounded for any run size.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        coaches_path: Path,
+        batch_size: int = 2048,
+        compression: str = "zstd",
+    ):
+        super().__init__(path)
+        self.coaches_path = coaches_path
+        self.batch_size = batch_size
+        self.coach_count = 0
+        self.programs = pq.ParquetWriter(path, PROGRAMS_SCHEMA, compression=compression)
+        self.coaches = pq.ParquetWriter(coaches_path, COACHES_SCHEMA, compression=compression)
+        self.program_rows = {name: [] for name in PROGRAMS_SCHEMA.names}
+        self.coach_rows = {name: [] for name in COACHES_SCHEMA.names}
+
+    def write(self, program: TennisProgram):
+        head = program.head_coach
+        rows = self.program_rows
+        rows["university"].append(program.university)
+        rows["gender"].append(program.gender.value)
+        rows["state"].append(program.state)
+        rows["division"].append(program.division.value)
+        rows["team_name"].append(program.team_name)
+        rows["head_coach_name"].append(head.name if head else None)
+        rows["head_coach_email"].append(head.email if head else None)
+        rows["head_coach_phone"].append(head.phone if head else None)
+        rows["assistant_count"].append(len(program.assistant_coaches))
+        rows["athletics_url"].append(program.athletics_url)
+        rows["tennis_page_url"].append(program.tennis_page_url)
+        rows["coaches_fingerprint"].append(program.coaches_fingerprint)
+        rows["scraped_at"].append(program.scraped_at)
+
+        coaches = [("head", head)] if head else []
+        coaches += [("assistant", c) for c in program.assistant_coaches]
+        rows = self.coach_rows
+        for position, (role, coach) in enumerate(coaches):
+            rows["university"].append(program.university)
+            rows["gender"].append(program.gender.value)
+            rows["role"].append(role)
+            rows["position"].append(position)
+            rows["name"].append(coach.name)
+            rows["title"].append(coach.title)
+            rows["email"].append(coach.email)
+            rows["phone"].append(coach.phone)
+        self.coach_count += len(coaches)
+
+        self.count += 1
+        if len(self.program_rows["university"]) >= self.batch_size:
+            self.flush()
+
+    def flush(self):
+        if self.program_rows["university"]:
+            self.programs.write_table(pa.table(self.program_rows, schema=PROGRAMS_SCHEMA))
+            self.program_rows = {name: [] for name in PROGRAMS_SCHEMA.names}
+        if self.coach_rows["university"]:
+            self.coaches.write_table(pa.table(self.coach_rows, schema=COACHES_SCHEMA))
+            self.coach_rows = {name: [] for name in COACHES_SCHEMA.names}
+
+    def close(self):
+        if self.programs is None:
+            return
+        self.flush()
+        self.programs.close()
+        self.coaches.close()
+        self.programs = None
+        self.coaches = None
@@ -0,0 +1,159 @@
+"""Shared department staff directories, fetched and indexed once per run.
+
+Some schools (Stanford) list every coach in one athletics-wide staff directory
+instead of per-sport coaches pages. Rather than re-scanning the whole
+directory for each program, it is parsed once into ``DirectoryRow`` records
+grouped by sport, and each sport/gender lookup is answered from memory.
+"""
+
+from dataclasses import dataclass, field
+
+from .extraction import MAILTO_RE, STAFF_PATH_RE, extract_email_from_mailto, get_parser_backend
+from .models import CoachRecord
+
+
+# Sports that rows are grouped under while indexing. Matching is by substring
+# of the row text, so a row can land in several groups; sports not listed
+# here are grouped on first lookup.
+GENDERED_SPORTS = [
+    "basketball", "cross country", "fencing", "golf", "gymnastics", "lacrosse",
+    "rowing", "soccer", "swimming", "tennis", "track", "volleyball", "water polo",
+]
+DIRECTORY_SPORTS = [
+    f"{prefix} {sport}" for sport in GENDERED_SPORTS for prefix in ("men's", "women's")
+] + ["baseball", "football", "softball"]
+
+# Name cells that are really contact labels or navigation
+NON_NAME_WORDS = ["email", "phone", "office", "staff directory"]
+
+
+@dataclass(slots=True)
+class DirectoryRow:
+    """One staff row: lowercased row text plus the fields a coach needs."""
+
+    text: str
+    name: str
+    title: str | None
+    email: str | None
+
+
+def index_directory_plain(html: str, backend: str = "lxml") -> list[dict]:
+    """Extract every staff row of a directory page as plain dicts.
+
+    Runs in the parse pool; rows without a usable name are dropped here
+    since no lookup could use them.
+    """
+    parser = get_parser_backend(backend)
+    root = parser.parse(html)
+    if root is None:
+        return []
+
+    rows = []
+    # Format: Name | Title | Email | Phone
+    for row, cells in parser.rows(root):
+        if len(cells) < 2:
+            continue
+
+        # Name is usually the staff profile link, else the first cell
+        name_link = parser.find_link(row, STAFF_PATH_RE)
+        if name_link is not None:
+            name = parser.stripped_text(name_link)
+        else:
+            name = parser.stripped_text(cells[0])
+
+        if len(name) < 3 or any(skip in name.lower() for skip in NON_NAME_WORDS):
+            continue
+
+        title = None
+        for cell in cells[1:]:
+            cell_text = parser.stripped_text(cell)
+            if "director" in cell_text.lower() or "coach" in cell_text.lower():
+                title = cell_text
+                break
+
+        email = None
+        mailto = parser.find_link(row, MAILTO_RE)
+        if mailto is not None:
+            email = extract_email_from_mailto(parser.attr(mailto, "href"))
+
+        rows.append({"text": parser.text(row).lower(), "name": name, "title": title, "email": email})
+    return rows
+
+
+@dataclass
+class DepartmentDirectory:
+    """An indexed staff directory answering per-sport coach lookups."""
+
+    url: str
+    rows: list[DirectoryRow]
+    by_sport: dict[str, list[DirectoryRow]] = field(default_factory=dict)
+    results: dict[str, tuple[CoachRecord | None, list[CoachRecord]]] = field(default_factory=dict)
+
+    @classmethod
+    def from_plain(cls, url: str, rows: list[dict]) -> "DepartmentDirectory":
+        directory = cls(url, [DirectoryRow(**row) for row in rows])
+        by_sport: dict[str, list[DirectoryRow]] = {sport: [] for sport in DIRECTORY_SPORTS}
+        for row in directory.rows:
+            for sport in DIRECTORY_SPORTS:
+                if sport in row.text:
+                    by_sport[sport].append(row)
+        directory.by_sport = by_sport
+        return directory
+
+    def sport_rows(self, sport: str) -> list[DirectoryRow]:
+        if sport not in self.by_sport:
+            self.by_sport[sport] = [row for row in self.rows if sport in row.text]
+        return self.by_sport[sport]
+
+    def coaches(self, sport: str) -> tuple[CoachRecord | None, list[CoachRecord]]:
+        """Head coach and assistants for a sport such as "women's tennis"."""
+        if sport not in self.results:
+            self.results[sport] = self.find_coaches(sport)
+        head, assistants = self.results[sport]
+        return head, list(assistants)
+
+    def find_coaches(self, sport: str) -> tuple[CoachRecord | None, list[CoachRecord]]:
+        # "men's tennis" -> "tennis"
+        sport_name = sport.split(" ", 1)[-1]
+        coaches: list[CoachRecord] = []
+        seen_names: set[str] = set()
+
+        for row in self.sport_rows(sport):
+            row_text = row.text
+
+            # Only coaching staff of this sport, not support staff who list it
+            # among several sports
+            is_coach = (
+                f"director of {sport}" in row_text or
+                f"director • {sport}" in row_text or
+                f"{sport} assistant coach" in row_text or
+                f"assistant {sport} coach" in row_text or
+                f"{sport} coach" in row_text or
+                "head coach" in row_text
+            )
+
+            # Also try Stanford's endowed position pattern
+            if not is_coach:
+                is_coach = (
+                    ("director" in row_text or "coach" in row_text) and
+                    ("taube" in row_text or "family" in row_text or "endowed" in row_text)
+                )
+
+            if not is_coach or row.name in seen_names:
+                continue
+            seen_names.add(row.name)
+
+            coach = CoachRecord(name=row.name, title=row.title, email=row.email, phone=None)
+
+            # The head coach is titled e.g. "Director of Men's Tennis"
+            title = (row.title or "").lower()
+            if "director of" in title and sport_name in title and "assistant" not in title:
+                # Everyone listed before the head coach is an assistant
+                return coach, coaches
+
+            coaches.append(coach)
+
+        # If no head coach found, the first sport-specific staff member likely is
+        if coaches:
+            return coaches[0], coaches[1:]
+        return None, []
@@ -0,0 +1,109 @@
+"""Streaming JSON, JSON Lines and CSV writers for scraped programs."""
+
+import csv
+import json
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Iterable
+
+from .models import ProgramRecord, TennisProgram
+
+
+class ProgramWriter(ABC):
+    """Write programs to a file one at a time, holding none of them in memory.
+
+    Subclasses implement ``write``; ``count`` tracks how many were written.
+    Usable as a context manager.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.count = 0
+        self.file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    @abstractmethod
+    def write(self, program: TennisProgram):
+        """Append one program to the file."""
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+
+class JsonArrayWriter(ProgramWriter):
+    """A JSON array laid out exactly like ``json.dump(programs, f, indent=2)``."""
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.file = open(path, "w")
+        self.file.write("[")
+
+    def write(self, program: TennisProgram):
+        item = json.dumps(program.model_dump(mode="json"), indent=2, default=str)
+        self.file.write(",\n  " if self.count else "\n  ")
+        self.file.write(item.replace("\n", "\n  "))
+        self.count += 1
+
+    def close(self):
+        if self.file:
+            self.file.write("\n]" if self.count else "]")
+        super().close()
+
+
+class JsonlWriter(ProgramWriter):
+    """One compact JSON object per line."""
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.file = open(path, "w")
+
+    def write(self, program: TennisProgram):
+        self.file.write(json.dumps(program.model_dump(mode="json"), default=str) + "\n")
+        self.count += 1
+
+
+class CsvWriter(ProgramWriter):
+    """Flattened rows (see ``TennisProgram.to_flat_dict``).
+
+    The file is only created once the first program arrives, since the header
+    comes from its keys.
+    """
+
+    def __init__(self, path: Path):
+        super().__init__(path)
+        self.writer: csv.DictWriter | None = None
+
+    def write(self, program: TennisProgram):
+        row = program.to_flat_dict()
+        if self.writer is None:
+            self.file = open(self.path, "w", newline="")
+            self.writer = csv.DictWriter(self.file, fieldnames=row.keys())
+            self.writer.writeheader()
+        self.writer.writerow(row)
+        self.count += 1
+
+
+def export_programs(programs: Iterable[ProgramRecord], writers: list[ProgramWriter]) -> int:
+    """Feed every program to all writers in a single pass and close them.
+
+    Exports are the validation boundary: each record is validated into a
+    ``TennisProgram`` once, as it is written.
+    """
+    count = 0
+    try:
+        for record in programs:
+            program = record.to_model()
+            for writer in writers:
+                writer.write(program)
+            count += 1
+    finally:
+        for writer in writers:
+            writer.close()
+    return count
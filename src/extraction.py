@@ -0,0 +1,777 @@
+"""Single-pass coach extraction engine for rendered staff pages.
+
+The extraction strategies are written once against a small set of DOM
+primitives (text, parent lookup, link lookup, selector match). Parser
+backends implement those primitives: ``SoupBackend`` on BeautifulSoup is the
+reference, ``LxmlBackend`` works on native lxml.html trees with XPath.
+"""
+
+import re
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+
+import lxml.html
+import soupsieve
+from bs4 import BeautifulSoup, Tag
+from lxml import etree
+
+from .models import CoachRecord
+
+
+MAILTO_RE = re.compile(r"^mailto:", re.I)
+TEL_RE = re.compile(r"^tel:", re.I)
+STAFF_LINK_RE = re.compile(r"/staff/[a-zA-Z0-9-]+", re.I)
+STAFF_PATH_RE = re.compile(r"/staff/", re.I)
+NAME_RE = re.compile(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b")
+
+# Common patterns: "John Smith Head Coach" or "Head Coach John Smith"
+TEXT_TITLE_RES = [
+    re.compile(p, re.I) for p in [
+        r"(Head Coach)",
+        r"(Associate Head Coach)",
+        r"(Assistant Coach)",
+        r"(Volunteer Assistant)",
+        r"(Director of Tennis)",
+        r"(Strength and Conditioning Coach[^,]*)",
+    ]
+]
+CARD_TITLE_RES = [
+    re.compile(p, re.I) for p in [r"(Head Coach)", r"(Assistant Coach)", r"(Associate Head Coach)"]
+]
+STAFF_LINK_TITLES = ["Head Coach", "Assistant Coach", "Associate Head Coach", "Volunteer"]
+
+CARD_NAME_SELECTORS = [
+    ".sidearm-coaches-coach-name",
+    "[class*='name']",
+    "h2", "h3", "h4",
+    "a[href*='/staff/']",
+]
+CARD_TITLE_SELECTORS = [
+    ".sidearm-coaches-coach-title",
+    "[class*='title']",
+    "[class*='position']",
+]
+
+# Parents searched for context around staff links and mailto anchors
+STAFF_LINK_PARENTS = ("div", "li", "article", "section", "tr")
+MAILTO_PARENTS = ("div", "li", "article", "tr", "section")
+
+# Class substrings that mark a coach card (see is_coach_card)
+CARD_CLASS_SUBSTRINGS = ("coach-card", "staff-card", "person-card")
+
+SKIP_NAME_PATTERNS = (
+    "head coach", "assistant", "volunteer", "director", "coach",
+    "read more", "view bio", "click", "loading", "staff",
+    "email", "phone", "office", "fax", "schedule", "roster",
+    "news", "tickets", "donate", "contact", "twitter", "instagram",
+    "facebook", "youtube", "tiktok", "print", "share",
+)
+
+
+def extract_email_from_mailto(href: str) -> str | None:
+    """Extract email from a mailto: href."""
+    if not href or "mailto:" not in href.lower():
+        return None
+    email = href.lower().replace("mailto:", "").split("?")[0].strip()
+    if "@" in email and "." in email.split("@")[1]:
+        return email
+    return None
+
+
+def extract_phone_from_tel(href: str) -> str | None:
+    """Extract phone from a tel: href."""
+    if not href or "tel:" not in href.lower():
+        return None
+    return href.replace("tel:", "").strip()
+
+
+def looks_like_person_name(text: str) -> bool:
+    """Check if text looks like a person's name."""
+    if not text or len(text) < 3 or len(text) > 60:
+        return False
+
+    lower = text.lower()
+    if any(p in lower for p in SKIP_NAME_PATTERNS):
+        return False
+
+    words = text.split()
+    if len(words) < 2:
+        return False
+
+    if not all(w[0].isupper() for w in words if w):
+        return False
+
+    return True
+
+
+def is_head_coach_title(title: str | None) -> bool:
+    """Whether a title names the head coach (not an associate/assistant)."""
+    if not title:
+        return False
+    lower = title.lower()
+    return "head coach" in lower and "assistant" not in lower and "associate" not in lower
+
+
+def split_head_coach(coaches: list[CoachRecord]) -> tuple[CoachRecord | None, list[CoachRecord]]:
+    """Separate the first head coach from everyone else."""
+    head_coach = None
+    assistants = []
+
+    for coach in coaches:
+        if is_head_coach_title(coach.title) and not head_coach:
+            head_coach = coach
+        else:
+            assistants.append(coach)
+
+    return head_coach, assistants
+
+
+def is_coach_card(name: str, classes: list[str]) -> bool:
+    """Match the Sidearm coach-card selectors without running a CSS query.
+
+    Equivalent to ``.sidearm-coaches-coach, [class*='coach-card'],
+    [class*='staff-card'], [class*='person-card'], article[class*='coach'],
+    li[class*='coach']``.
+    """
+    if not classes:
+        return False
+    if "sidearm-coaches-coach" in classes:
+        return True
+    joined = " ".join(classes)
+    if any(s in joined for s in CARD_CLASS_SUBSTRINGS):
+        return True
+    return name in ("article", "li") and "coach" in joined
+
+
+def extract_name_title_from_text(text: str) -> tuple[str | None, str | None]:
+    """Extract name and title from a text block."""
+    title = None
+    for pattern in TEXT_TITLE_RES:
+        match = pattern.search(text)
+        if match:
+            title = match.group(1)
+            break
+
+    # Try to find a name (2+ capitalized words in sequence)
+    name_match = NAME_RE.search(text)
+    name = None
+    if name_match:
+        potential_name = name_match.group(1)
+        # Make sure it's not just the title
+        if title and potential_name.lower() == title.lower():
+            # Try to find another name
+            remaining = text.replace(potential_name, "", 1)
+            name_match = NAME_RE.search(remaining)
+            if name_match:
+                name = name_match.group(1)
+        else:
+            name = potential_name
+
+    return name, title
+
+
+@dataclass
+class DocumentIndex:
+    """Everything the extraction strategies need, collected in one walk.
+
+    ``tables`` holds, per ``<table>``, its descendant rows as (row, cells)
+    pairs in document order, mirroring ``table.find_all("tr")`` and
+    ``row.find_all(["td", "th"])``. ``first_mailto``/``first_tel`` map the
+    ``id()`` of every cell and card to its first mailto/tel anchor, replacing
+    per-node ``find`` calls. ``scope_nodes`` keeps those nodes alive so their
+    ids stay unique (lxml creates element proxies on demand).
+    """
+
+    tables: list[list[tuple[object, list]]] = field(default_factory=list)
+    cards: list = field(default_factory=list)
+    staff_links: list = field(default_factory=list)
+    mailto_links: list = field(default_factory=list)
+    tel_links: list = field(default_factory=list)
+    first_mailto: dict[int, object] = field(default_factory=dict)
+    first_tel: dict[int, object] = field(default_factory=dict)
+    scope_nodes: list = field(default_factory=list)
+
+
+class ParserBackend(ABC):
+    """Coach extraction strategies over a parser-specific set of DOM primitives.
+
+    Subclasses implement ``parse`` and the primitives below; everything from
+    ``build_index`` down is shared, so all backends make the same decisions.
+    """
+
+    name = ""
+
+    def __init__(self):
+        self.card_name_selectors = [self.compile_selector(s) for s in CARD_NAME_SELECTORS]
+        self.card_title_selectors = [self.compile_selector(s) for s in CARD_TITLE_SELECTORS]
+
+    @abstractmethod
+    def parse(self, html: str):
+        """Parse HTML into a root node (or None if there is nothing to parse)."""
+
+    @abstractmethod
+    def element_children(self, node) -> list:
+        """Child elements, skipping text, comments and other non-element nodes."""
+
+    @abstractmethod
+    def tag_name(self, node) -> str:
+        """Lowercase tag name."""
+
+    @abstractmethod
+    def attr(self, node, name: str) -> str | None:
+        """Attribute value, or None if absent."""
+
+    @abstractmethod
+    def classes(self, node) -> list[str]:
+        """The node's CSS classes."""
+
+    @abstractmethod
+    def text(self, node) -> str:
+        """All text under the node, like ``get_text()``."""
+
+    @abstractmethod
+    def stripped_text(self, node, separator: str = "") -> str:
+        """Stripped, non-empty strings joined by ``separator``, like ``get_text(separator, strip=True)``."""
+
+    @abstractmethod
+    def find_parent(self, node, names: tuple[str, ...]):
+        """Nearest ancestor whose tag is in ``names``."""
+
+    @abstractmethod
+    def find_link(self, node, pattern: re.Pattern):
+        """First descendant ``<a>`` whose href matches ``pattern``."""
+
+    @abstractmethod
+    def find_first(self, node, name: str):
+        """First descendant with the given tag name."""
+
+    @abstractmethod
+    def rows(self, root) -> list[tuple[object, list]]:
+        """Every ``<tr>`` under root with its ``<td>``/``<th>`` cells, in document order."""
+
+    @abstractmethod
+    def compile_selector(self, selector: str):
+        """Prepare one of the card selectors for ``select_one``."""
+
+    @abstractmethod
+    def select_one(self, node, compiled):
+        """First descendant matching a selector compiled by ``compile_selector``."""
+
+    def build_index(self, root) -> DocumentIndex:
+        """Walk the document once and index tables, cards and contact links."""
+        index = DocumentIndex()
+        element_children = self.element_children
+        tag_name = self.tag_name
+
+        # Each entry carries the row lists of enclosing tables, the cell lists of
+        # enclosing rows and the ids of enclosing cells/cards, so nested structures
+        # are attributed exactly like find_all/find would
+        stack: list[tuple[object, tuple, tuple, tuple]] = [
+            (child, (), (), ()) for child in reversed(element_children(root))
+        ]
+        while stack:
+            node, open_tables, open_rows, open_scopes = stack.pop()
+
+            name = tag_name(node)
+            if name == "table":
+                rows: list = []
+                index.tables.append(rows)
+                open_tables = open_tables + (rows,)
+            elif name == "tr":
+                cells: list = []
+                for rows in open_tables:
+                    rows.append((node, cells))
+                open_rows = open_rows + (cells,)
+            elif name == "td" or name == "th":
+                for cells in open_rows:
+                    cells.append(node)
+                index.scope_nodes.append(node)
+                open_scopes = open_scopes + (id(node),)
+            elif name == "a":
+                href = self.attr(node, "href")
+                if href:
+                    if MAILTO_RE.search(href):
+                        index.mailto_links.append(node)
+                        for scope in open_scopes:
+                            index.first_mailto.setdefault(scope, node)
+                    if TEL_RE.search(href):
+                        index.tel_links.append(node)
+                        for scope in open_scopes:
+                            index.first_tel.setdefault(scope, node)
+                    if STAFF_LINK_RE.search(href):
+                        index.staff_links.append(node)
+
+            if is_coach_card(name, self.classes(node)):
+                index.cards.append(node)
+                index.scope_nodes.append(node)
+                open_scopes = open_scopes + (id(node),)
+
+            for child in reversed(element_children(node)):
+                stack.append((child, open_tables, open_rows, open_scopes))
+
+        return index
+
+    def extract_coach_from_row(self, cells: list, index: DocumentIndex) -> CoachRecord | None:
+        """Extract coach info from a table row."""
+        if len(cells) < 2:
+            return None
+
+        name = None
+        title = None
+        email = None
+        phone = None
+
+        for cell in cells:
+            text = self.stripped_text(cell)
+
+            # Check for email link
+            mailto = index.first_mailto.get(id(cell))
+            if mailto is not None:
+                email = extract_email_from_mailto(self.attr(mailto, "href"))
+                continue
+
+            # Check for phone
+            tel = index.first_tel.get(id(cell))
+            if tel is not None:
+                phone = extract_phone_from_tel(self.attr(tel, "href"))
+                continue
+
+            # Check if it looks like a name first (before title check)
+            if looks_like_person_name(text) and not name:
+                name = text
+                continue
+
+            # Check if it's a title - must contain space and coaching keyword
+            # Avoid matching social media handles like "coachjamiehunt"
+            if " " in text and any(t in text.lower() for t in ["coach", "director", "coordinator"]):
+                title = text
+                continue
+
+        if not name:
+            return None
+
+        return CoachRecord(name=name, title=title, email=email, phone=phone)
+
+    def extract_coach_from_card(self, card, index: DocumentIndex) -> CoachRecord | None:
+        """Extract coach info from a card element."""
+        # Find name
+        name = None
+        for selector in self.card_name_selectors:
+            elem = self.select_one(card, selector)
+            if elem is not None:
+                text = self.stripped_text(elem)
+                if looks_like_person_name(text):
+                    name = text
+                    break
+
+        if not name:
+            return None
+
+        # Find title
+        title = None
+        for selector in self.card_title_selectors:
+            elem = self.select_one(card, selector)
+            if elem is not None:
+                text = self.stripped_text(elem)
+                if "coach" in text.lower() or "director" in text.lower():
+                    title = text
+                    break
+
+        if not title:
+            # Look in card text for coach keywords
+            card_text = self.text(card)
+            for pattern in CARD_TITLE_RES:
+                match = pattern.search(card_text)
+                if match:
+                    title = match.group(1)
+                    break
+
+        # Find email
+        email = None
+        mailto = index.first_mailto.get(id(card))
+        if mailto is not None:
+            email = extract_email_from_mailto(self.attr(mailto, "href"))
+
+        # Find phone
+        phone = None
+        tel = index.first_tel.get(id(card))
+        if tel is not None:
+            phone = extract_phone_from_tel(self.attr(tel, "href"))
+
+        return CoachRecord(name=name, title=title, email=email, phone=phone)
+
+    def extract_coaches(self, index: DocumentIndex) -> list[CoachRecord]:
+        """Run the extraction strategies, in priority order, against an index."""
+        coaches: list[CoachRecord] = []
+        seen_names: set[str] = set()
+
+        # Strategy 1: Parse table rows (common on newer Sidearm sites)
+        for rows in index.tables:
+            for _, cells in rows:
+                if len(cells) >= 2:
+                    coach = self.extract_coach_from_row(cells, index)
+                    if coach and coach.name not in seen_names:
+                        seen_names.add(coach.name)
+                        coaches.append(coach)
+
+        # Strategy 2: Look for coach cards (common Sidearm patterns)
+        if not coaches:
+            for card in index.cards:
+                coach = self.extract_coach_from_card(card, index)
+                if coach and coach.name not in seen_names:
+                    seen_names.add(coach.name)
+                    coaches.append(coach)
+
+        # Strategy 3: Look for staff links and extract info
+        if not coaches:
+            for link in index.staff_links[:15]:
+                name = self.stripped_text(link)
+                if looks_like_person_name(name) and name not in seen_names:
+                    seen_names.add(name)
+
+                    parent = self.find_parent(link, STAFF_LINK_PARENTS)
+                    email = None
+                    title = None
+                    phone = None
+
+                    if parent is not None:
+                        mailto = self.find_link(parent, MAILTO_RE)
+                        if mailto is not None:
+                            email = extract_email_from_mailto(self.attr(mailto, "href"))
+
+                        tel = self.find_link(parent, TEL_RE)
+                        if tel is not None:
+                            phone = extract_phone_from_tel(self.attr(tel, "href"))
+
+                        # Look for title
+                        parent_text = self.text(parent).lower()
+                        for pattern in STAFF_LINK_TITLES:
+                            if pattern.lower() in parent_text:
+                                title = pattern
+                                break
+
+                    coaches.append(CoachRecord(name=name, title=title, email=email, phone=phone))
+
+        # Strategy 4: Match emails to names via context text
+        if not coaches:
+            for mailto in index.mailto_links[:15]:
+                email = extract_email_from_mailto(self.attr(mailto, "href"))
+                if not email:
+                    continue
+
+                # Get surrounding context - walk up to find a container
+                parent = self.find_parent(mailto, MAILTO_PARENTS)
+                if parent is None:
+                    continue
+
+                parent_text = self.stripped_text(parent, " ")
+
+                # Try to find name and title in the text
+                name, title = extract_name_title_from_text(parent_text)
+
+                if name and name not in seen_names:
+                    seen_names.add(name)
+                    coaches.append(CoachRecord(name=name, title=title, email=email, phone=None))
+
+        return coaches
+
+    def parse_coaches(self, html: str) -> tuple[CoachRecord | None, list[CoachRecord]]:
+        """Parse coach information from rendered HTML."""
+        root = self.parse(html)
+        if root is None:
+            return None, []
+        return split_head_coach(self.extract_coaches(self.build_index(root)))
+
+    def parse_roster_coaches(self, html: str) -> tuple[CoachRecord | None, list[CoachRecord]]:
+        """Parse a roster page's coaches section (name | title | ... table rows)."""
+        root = self.parse(f"<div>{html}</div>")
+        coaches: list[CoachRecord] = []
+        seen_names: set[str] = set()
+
+        # Look for table rows (Arkansas pattern)
+        for row, cells in self.rows(root):
+            if len(cells) < 2:
+                continue
+
+            name = None
+            title = None
+            email = None
+
+            # First cell usually has name with link
+            name_cell = cells[0]
+            name_link = self.find_first(name_cell, "a")
+            if name_link is not None:
+                name = self.stripped_text(name_link)
+            else:
+                name = self.stripped_text(name_cell)
+
+            if not name or not looks_like_person_name(name):
+                continue
+
+            # Second cell usually has title
+            if len(cells) >= 2:
+                title = self.stripped_text(cells[1])
+
+            # Look for email in the row
+            mailto = self.find_link(row, MAILTO_RE)
+            if mailto is not None:
+                email = extract_email_from_mailto(self.attr(mailto, "href"))
+
+            if name not in seen_names:
+                seen_names.add(name)
+                coaches.append(CoachRecord(name=name, title=title, email=email, phone=None))
+
+        # Separate head coach from assistants
+        return split_head_coach(coaches)
+
+
+class SoupBackend(ParserBackend):
+    """Reference backend on BeautifulSoup with the lxml tree builder."""
+
+    name = "soup"
+
+    def parse(self, html: str):
+        return BeautifulSoup(html, "lxml")
+
+    def element_children(self, node) -> list:
+        return [c for c in node.contents if isinstance(c, Tag)]
+
+    def tag_name(self, node) -> str:
+        return node.name
+
+    def attr(self, node, name: str) -> str | None:
+        return node.get(name)
+
+    def classes(self, node) -> list[str]:
+        return node.get("class") or []
+
+    def text(self, node) -> str:
+        return node.get_text()
+
+    def stripped_text(self, node, separator: str = "") -> str:
+        return node.get_text(separator=separator, strip=True)
+
+    def find_parent(self, node, names: tuple[str, ...]):
+        return node.find_parent(list(names))
+
+    def find_link(self, node, pattern: re.Pattern):
+        return node.find("a", href=pattern)
+
+    def find_first(self, node, name: str):
+        return node.find(name)
+
+    def rows(self, root) -> list[tuple[object, list]]:
+        return [(row, row.find_all(["td", "th"])) for row in root.find_all("tr")]
+
+    def compile_selector(self, selector: str):
+        return soupsieve.compile(selector)
+
+    def select_one(self, node, compiled):
+        return compiled.select_one(node)
+
+
+# Elements whose text BeautifulSoup leaves out of get_text()
+NON_TEXT_TAGS = frozenset({"script", "style", "template"})
+
+# BeautifulSoup collapses strings of only these characters to "\n" or " ",
+# except inside whitespace-preserving tags
+ASCII_SPACES = "\x20\x0a\x09\x0c\x0d"
+PRESERVE_WHITESPACE_TAGS = frozenset({"pre", "textarea"})
+
+
+def collapse_whitespace(text: str) -> str:
+    """A whitespace-only string as BeautifulSoup stores it."""
+    if text.strip(ASCII_SPACES):
+        return text
+    return "\n" if "\n" in text else " "
+
+
+# XPath equivalents of the card selectors, relative to the card
+SELECTOR_XPATHS = {
+    ".sidearm-coaches-coach-name":
+        "(.//*[contains(concat(' ', normalize-space(@class), ' '), ' sidearm-coaches-coach-name ')])[1]",
+    ".sidearm-coaches-coach-title":
+        "(.//*[contains(concat(' ', normalize-space(@class), ' '), ' sidearm-coaches-coach-title ')])[1]",
+    "[class*='name']": "(.//*[contains(@class, 'name')])[1]",
+    "[class*='title']": "(.//*[contains(@class, 'title')])[1]",
+    "[class*='position']": "(.//*[contains(@class, 'position')])[1]",
+    "h2": "(.//h2)[1]",
+    "h3": "(.//h3)[1]",
+    "h4": "(.//h4)[1]",
+    "a[href*='/staff/']": "(.//a[contains(@href, '/staff/')])[1]",
+}
+
+
+class LxmlBackend(ParserBackend):
+    """Native lxml.html backend: no BeautifulSoup tree, selectors as compiled XPath."""
+
+    name = "lxml"
+
+    def parse(self, html: str):
+        try:
+            root = lxml.html.document_fromstring(html)
+        except ValueError:
+            # Unicode input with an XML encoding declaration
+            root = lxml.html.document_fromstring(html.encode("utf-8"))
+        except etree.ParserError:
+            # Empty document
+            return None
+        self.drop_template_text(root)
+        return root
+
+    @staticmethod
+    def drop_template_text(root):
+        """Blank all text inside ``<template>`` elements.
+
+        BeautifulSoup keeps template content as elements but stores its
+        strings as ``TemplateString``, which ``get_text`` skips, so nothing
+        hidden in a template has any text there.
+        """
+        for template in root.iter("template"):
+            template.text = None
+            for node in template.iterdescendants():
+                node.text = None
+                node.tail = None
+
+    def element_children(self, node) -> list:
+        # Comments and processing instructions have non-string tags
+        return [c for c in node if isinstance(c.tag, str)]
+
+    def tag_name(self, node) -> str:
+        return node.tag
+
+    def attr(self, node, name: str) -> str | None:
+        return node.get(name)
+
+    def classes(self, node) -> list[str]:
+        return node.get("class", "").split()
+
+    def iter_text(self, node, preserve: bool = False):
+        """Yield text like BeautifulSoup: skip comments and script/style/template,
+        and collapse whitespace-only strings outside ``<pre>``/``<textarea>``."""
+        inner = preserve or node.tag in PRESERVE_WHITESPACE_TAGS
+        if node.text:
+            yield node.text if inner else collapse_whitespace(node.text)
+        for child in node:
+            if isinstance(child.tag, str) and child.tag not in NON_TEXT_TAGS:
+                yield from self.iter_text(child, inner)
+            if child.tail:
+                yield child.tail if inner else collapse_whitespace(child.tail)
+
+    def text(self, node) -> str:
+        return "".join(self.iter_text(node))
+
+    def stripped_text(self, node, separator: str = "") -> str:
+        return separator.join(s for s in (t.strip() for t in self.iter_text(node)) if s)
+
+    def find_parent(self, node, names: tuple[str, ...]):
+        for ancestor in node.iterancestors(*names):
+            return ancestor
+        return None
+
+    def find_link(self, node, pattern: re.Pattern):
+        for link in node.iterdescendants("a"):
+            href = link.get("href")
+            if href and pattern.search(href):
+                return link
+        return None
+
+    def find_first(self, node, name: str):
+        return next(node.iterdescendants(name), None)
+
+    def rows(self, root) -> list[tuple[object, list]]:
+        return [(row, list(row.iterdescendants("td", "th"))) for row in root.iter("tr")]
+
+    def compile_selector(self, selector: str):
+        return etree.XPath(SELECTOR_XPATHS[selector])
+
+    def select_one(self, node, compiled):
+        found = compiled(node)
+        return found[0] if found else None
+
+
+PARSER_BACKENDS: dict[str, ParserBackend] = {
+    backend.name: backend for backend in (SoupBackend(), LxmlBackend())
+}
+
+
+def get_parser_backend(name: str) -> ParserBackend:
+    """Look up a parser backend by name ("soup" or "lxml")."""
+    try:
+        return PARSER_BACKENDS[name]
+    except KeyError:
+        raise ValueError(f"Unknown parser backend {name!r}, expected one of {sorted(PARSER_BACKENDS)}")
+
+
+def parse_coaches(html: str, backend: str = "soup") -> tuple[CoachRecord | None, list[CoachRecord]]:
+    """Parse coach information from rendered HTML."""
+    return get_parser_backend(backend).parse_coaches(html)
+
+
+def coaches_to_plain(result: tuple[CoachRecord | None, list[CoachRecord]]) -> tuple[dict | None, list[dict]]:
+    """Convert a (head, assistants) result to plain dicts for crossing process boundaries."""
+    head, assistants = result
+    return (head.to_dict() if head else None, [c.to_dict() for c in assistants])
+
+
+def coaches_from_plain(plain: tuple[dict | None, list[dict]]) -> tuple[CoachRecord | None, list[CoachRecord]]:
+    """Inverse of coaches_to_plain."""
+    head, assistants = plain
+    return (CoachRecord(**head) if head else None, [CoachRecord(**c) for c in assistants])
+
+
+# Executor entry points: take an HTML string, return only plain coach data
+
+
+def parse_coaches_plain(html: str, backend: str = "lxml") -> tuple[dict | None, list[dict]]:
+    return coaches_to_plain(get_parser_backend(backend).parse_coaches(html))
+
+
+def parse_roster_coaches_plain(html: str, backend: str = "lxml") -> tuple[dict | None, list[dict]]:
+    return coaches_to_plain(get_parser_backend(backend).parse_roster_coaches(html))
+
+
+def check_parity(html: str, backends: tuple[str, ...] = ("soup", "lxml")) -> dict[str, tuple]:
+    """Parse with several backends; returns their results if they disagree, else {}."""
+    results = {name: parse_coaches(html, name) for name in backends}
+    dumps = {
+        name: (head and head.to_dict(), [c.to_dict() for c in assistants])
+        for name, (head, assistants) in results.items()
+    }
+    if len({repr(d) for d in dumps.values()}) <= 1:
+        return {}
+    return results
+
+
+def main():
+    """Check that every parser backend extracts the same coaches from cached pages."""
+    import argparse
+    from pathlib import Path
+
+    from .html_cache import HtmlCache
+
+    parser = argparse.ArgumentParser(description="Compare parser backends on cached HTML")
+    parser.add_argument("--html-cache", type=Path, default=Path("data/html_cache"))
+    args = parser.parse_args()
+
+    cache = HtmlCache(args.html_cache)
+    entries = cache.conn.execute("SELECT url, mode FROM entries ORDER BY url").fetchall()
+    mismatches = 0
+    for url, mode in entries:
+        cached = cache.get(url, mode)
+        if not cached:
+            continue
+        diff = check_parity(cached.html)
+        if diff:
+            mismatches += 1
+            print(f"MISMATCH {mode} {url}")
+            for name, result in diff.items():
+                print(f"  {name}: {result}")
+    cache.close()
+
+    print(f"{len(entries)} pages checked, {mismatches} mismatches")
+    raise SystemExit(1 if mismatches else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+"""In-page extraction of the DOM fragments that coach parsing actually reads."""
+
+import hashlib
+import re
+
+import lxml.html
+from playwright.async_api import Page
+
+from .extraction import STAFF_LINK_RE, get_parser_backend, is_coach_card
+
+
+# Collects every node the extraction strategies can look at and returns their
+# outerHTML in document order, with nodes nested inside another kept node
+# dropped:
+#   - all tables (strategy 1 and the directory/roster row scans),
+#   - coach cards (strategy 2, same selector list as the parser),
+#   - the nearest div/li/article/section/tr around each staff link (strategy 3)
+#     and each mailto link (strategy 4), or the link itself if there is none,
+#   - the #coaches roster section.
+# Because each kept node is serialized whole, parent lookups, text and
+# per-cell/per-card links resolve the same as against the full page.
+COACH_FRAGMENT_JS = """
+() => {
+    const picked = new Set();
+    const add = (el) => { if (el) picked.add(el); };
+
+    document.querySelectorAll('table').forEach(add);
+    document.querySelectorAll(
+        ".sidearm-coaches-coach, [class*='coach-card'], [class*='staff-card'], " +
+        "[class*='person-card'], article[class*='coach'], li[class*='coach']"
+    ).forEach(add);
+    add(document.getElementById('coaches'));
+
+    const staffRe = /\\/staff\\/[a-zA-Z0-9-]+/i;
+    const mailtoRe = /^mailto:/i;
+    for (const a of document.querySelectorAll('a[href]')) {
+        const href = a.getAttribute('href');
+        if (staffRe.test(href)) add(a.closest('div, li, article, section, tr') || a);
+        if (mailtoRe.test(href)) add(a.closest('div, li, article, tr, section') || a);
+    }
+
+    const kept = [...picked].filter(el => {
+        for (let p = el.parentElement; p; p = p.parentElement) {
+            if (picked.has(p)) return false;
+        }
+        return true;
+    });
+    kept.sort((a, b) =>
+        a.compareDocumentPosition(b) & Node.DOCUMENT_POSITION_FOLLOWING ? -1 : 1
+    );
+    return kept.map(el => el.outerHTML).join('\\n');
+}
+"""
+
+
+async def extract_coach_fragment(page: Page) -> str:
+    """Serialize only the coach-candidate nodes of the rendered page."""
+    fragment = await page.evaluate(COACH_FRAGMENT_JS)
+    return f"<html><body>\n{fragment}\n</body></html>"
+
+
+MAILTO_RE = re.compile(r"^mailto:", re.I)
+STAFF_LINK_CONTAINERS = ("div", "li", "article", "section", "tr")
+MAILTO_CONTAINERS = ("div", "li", "article", "tr", "section")
+
+
+def closest_container(node, tags: tuple[str, ...]):
+    """Nearest ancestor with one of ``tags``, or the node itself if there is none."""
+    for ancestor in node.iterancestors(*tags):
+        return ancestor
+    return node
+
+
+def coach_fragment_from_html(html: str) -> str:
+    """The same coach-candidate nodes ``COACH_FRAGMENT_JS`` picks, from served HTML.
+
+    Only meant for fingerprinting: lxml percent-escapes spaces in hrefs when
+    serializing (``mailto: x`` becomes ``mailto:%20x``), so coaches are still
+    parsed from the page itself.
+    """
+    root = get_parser_backend("lxml").parse(html)
+    if root is None:
+        return "<html><body>\n\n</body></html>"
+
+    picked: dict[int, object] = {}
+
+    def add(node):
+        if node is not None:
+            picked.setdefault(id(node), node)
+
+    coaches_section = None
+    for node in root.iter():
+        # Comments and processing instructions have non-string tags
+        if not isinstance(node.tag, str):
+            continue
+        if node.tag == "table" or is_coach_card(node.tag, (node.get("class") or "").split()):
+            add(node)
+        if coaches_section is None and node.get("id") == "coaches":
+            coaches_section = node
+        href = node.get("href") if node.tag == "a" else None
+        if href is not None:
+            if STAFF_LINK_RE.search(href):
+                add(closest_container(node, STAFF_LINK_CONTAINERS))
+            if MAILTO_RE.search(href):
+                add(closest_container(node, MAILTO_CONTAINERS))
+    add(coaches_section)
+
+    def nested(node) -> bool:
+        return any(id(ancestor) in picked for ancestor in node.iterancestors())
+
+    # root.iter() is document order, so only the nesting filter is needed
+    kept = [node for node in root.iter() if id(node) in picked and not nested(node)]
+    fragment = "\n".join(lxml.html.tostring(node, encoding="unicode", with_tail=False) for node in kept)
+    return f"<html><body>\n{fragment}\n</body></html>"
+
+
+def fingerprint_fragment(html: str) -> str:
+    """Stable hash of an extracted fragment, used to detect unchanged coach pages."""
+    return hashlib.sha256(html.encode("utf-8")).hexdigest()
+
+
+def fingerprint_static_page(html: str) -> str:
+    """Fingerprint of a served page's coach nodes.
+
+    The full page changes on every request (ads, timestamps, tokens), so
+    static pages are compared on the same nodes rendered pages are.
+    """
+    return fingerprint_fragment(coach_fragment_from_html(html))
@@ -0,0 +1,196 @@
+"""Content-addressed on-disk cache of fetched HTML with HTTP validators."""
+
+import gzip
+import hashlib
+import sqlite3
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    digest TEXT PRIMARY KEY,
+    size INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT NOT NULL,
+    mode TEXT NOT NULL,
+    digest TEXT NOT NULL REFERENCES blobs (digest),
+    etag TEXT,
+    last_modified TEXT,
+    fetched_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    PRIMARY KEY (url, mode)
+);
+CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed_at);
+CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest);
+"""
+
+
+@dataclass
+class CachedPage:
+    """A cached response body and the validators needed to revalidate it."""
+
+    url: str
+    mode: str
+    html: str
+    digest: str
+    etag: str | None
+    last_modified: str | None
+    fetched_at: float
+    fresh: bool
+
+
+class HtmlCache:
+    """Gzip-compressed HTML blobs addressed by content hash, indexed in SQLite.
+
+    Entries are keyed by (url, mode), where mode says how the HTML was obtained
+    (e.g. "rendered" for a full browser render, "fragment" for the extracted
+    coach-candidate nodes, "roster" for the extracted roster coaches section,
+    "static" for the page as served over plain HTTP).
+    Identical bodies share a single blob. Entries younger than ``max_age``
+    seconds are fresh; older ones must be revalidated with their
+    ETag/Last-Modified. When the blobs exceed ``max_bytes`` the
+    least recently used entries are evicted.
+    """
+
+    def __init__(
+        self,
+        root: Path = Path("data/html_cache"),
+        max_age: float = 7 * 24 * 3600,
+        max_bytes: int = 500_000_000,
+    ):
+        self.root = root
+        self.blob_dir = root / "blobs"
+        self.blob_dir.mkdir(parents=True, exist_ok=True)
+        self.max_age = max_age
+        self.max_bytes = max_bytes
+        self.conn = sqlite3.connect(root / "index.sqlite")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def blob_path(self, digest: str) -> Path:
+        return self.blob_dir / digest[:2] / f"{digest}.html.gz"
+
+    def get(self, url: str, mode: str) -> CachedPage | None:
+        """Look up a cached page, marking it as recently used."""
+        row = self.conn.execute(
+            "SELECT digest, etag, last_modified, fetched_at FROM entries WHERE url = ? AND mode = ?",
+            (url, mode),
+        ).fetchone()
+        if not row:
+            return None
+
+        digest, etag, last_modified, fetched_at = row
+        try:
+            html = gzip.decompress(self.blob_path(digest).read_bytes()).decode("utf-8")
+        except (OSError, EOFError):
+            # Blob went missing or is corrupt; forget the entry
+            self.delete(url, mode)
+            return None
+
+        self.conn.execute(
+            "UPDATE entries SET accessed_at = ? WHERE url = ? AND mode = ?",
+            (time.time(), url, mode),
+        )
+        self.conn.commit()
+        return CachedPage(
+            url=url,
+            mode=mode,
+            html=html,
+            digest=digest,
+            etag=etag,
+            last_modified=last_modified,
+            fetched_at=fetched_at,
+            fresh=time.time() - fetched_at < self.max_age,
+        )
+
+    def put(
+        self,
+        url: str,
+        mode: str,
+        html: str,
+        etag: str | None = None,
+        last_modified: str | None = None,
+    ):
+        """Store a page body and its validators, then enforce the size cap."""
+        data = html.encode("utf-8")
+        digest = hashlib.sha256(data).hexdigest()
+        path = self.blob_path(digest)
+
+        if not path.exists():
+            compressed = gzip.compress(data)
+            path.parent.mkdir(exist_ok=True)
+            tmp = path.with_suffix(".tmp")
+            tmp.write_bytes(compressed)
+            tmp.replace(path)
+            self.conn.execute(
+                "INSERT OR REPLACE INTO blobs (digest, size) VALUES (?, ?)",
+                (digest, len(compressed)),
+            )
+
+        old = self.conn.execute(
+            "SELECT digest FROM entries WHERE url = ? AND mode = ?", (url, mode)
+        ).fetchone()
+
+        now = time.time()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO entries "
+            "(url, mode, digest, etag, last_modified, fetched_at, accessed_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (url, mode, digest, etag, last_modified, now, now),
+        )
+        if old and old[0] != digest:
+            self.drop_blob_if_unused(old[0])
+        self.conn.commit()
+
+        self.evict()
+
+    def touch(self, url: str, mode: str):
+        """Mark an entry as freshly validated (e.g. after a 304)."""
+        now = time.time()
+        self.conn.execute(
+            "UPDATE entries SET fetched_at = ?, accessed_at = ? WHERE url = ? AND mode = ?",
+            (now, now, url, mode),
+        )
+        self.conn.commit()
+
+    def delete(self, url: str, mode: str):
+        row = self.conn.execute(
+            "SELECT digest FROM entries WHERE url = ? AND mode = ?", (url, mode)
+        ).fetchone()
+        self.conn.execute("DELETE FROM entries WHERE url = ? AND mode = ?", (url, mode))
+        if row:
+            self.drop_blob_if_unused(row[0])
+        self.conn.commit()
+
+    def drop_blob_if_unused(self, digest: str):
+        in_use = self.conn.execute(
+            "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+        ).fetchone()
+        if in_use:
+            return
+        self.conn.execute("DELETE FROM blobs WHERE digest = ?", (digest,))
+        self.blob_path(digest).unlink(missing_ok=True)
+
+    def total_bytes(self) -> int:
+        return self.conn.execute("SELECT COALESCE(SUM(size), 0) FROM blobs").fetchone()[0]
+
+    def evict(self):
+        """Drop least recently used entries until blobs fit in ``max_bytes``."""
+        total = self.total_bytes()
+        if total <= self.max_bytes:
+            return
+
+        victims = self.conn.execute(
+            "SELECT url, mode FROM entries ORDER BY accessed_at ASC"
+        ).fetchall()
+        for url, mode in victims:
+            if total <= self.max_bytes:
+                break
+            self.delete(url, mode)
+            total = self.total_bytes()
@@ -0,0 +1,106 @@
+"""Incremental re-crawls: reuse the previous export and report coach changes."""
+
+import json
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from .models import CoachRecord, Gender, ProgramRecord
+
+
+console = Console()
+
+ProgramKey = tuple[str, Gender]
+
+
+def latest_export(output_dir: Path) -> Path | None:
+    """The most recent all_tennis_programs_*.json in ``output_dir``."""
+    # Timestamps are YYYYmmdd_HHMMSS, so name order is chronological
+    exports = sorted(output_dir.glob("all_tennis_programs_*.json"))
+    return exports[-1] if exports else None
+
+
+def load_previous(path: Path) -> dict[ProgramKey, ProgramRecord]:
+    """Index a previous export by (university, gender)."""
+    with open(path) as f:
+        saved = json.load(f)
+    programs = [ProgramRecord.from_dict(p) for p in saved]
+    return {(p.university, p.gender): p for p in programs}
+
+
+def all_coaches(program: ProgramRecord) -> list[CoachRecord]:
+    coaches = [program.head_coach] if program.head_coach else []
+    return coaches + list(program.assistant_coaches)
+
+
+def coach_changes(before: ProgramRecord | None, after: ProgramRecord) -> list[dict]:
+    """Coaches added, removed or with a changed email, matched by name."""
+    old = {c.name.casefold(): c for c in all_coaches(before)} if before else {}
+    new = {c.name.casefold(): c for c in all_coaches(after)}
+
+    changes = []
+    for key, coach in new.items():
+        if key not in old:
+            changes.append({"change": "added", "name": coach.name, "title": coach.title, "email": coach.email})
+        elif old[key].email != coach.email:
+            changes.append({
+                "change": "email_changed",
+                "name": coach.name,
+                "title": coach.title,
+                "old_email": old[key].email,
+                "email": coach.email,
+            })
+    for key, coach in old.items():
+        if key not in new:
+            changes.append({"change": "removed", "name": coach.name, "title": coach.title, "email": coach.email})
+    return changes
+
+
+def build_delta(previous: dict[ProgramKey, ProgramRecord], programs: list[ProgramRecord]) -> list[dict]:
+    """Per-program coach changes relative to the previous export; unchanged programs are left out."""
+    delta = []
+    for program in programs:
+        changes = coach_changes(previous.get((program.university, program.gender)), program)
+        if changes:
+            delta.append({
+                "university": program.university,
+                "gender": program.gender.value,
+                "changes": changes,
+            })
+    return delta
+
+
+def export_delta(delta: list[dict], baseline: Path, output_dir: Path, timestamp: str) -> Path:
+    """Write the changes-only report next to the full export."""
+    path = output_dir / f"coach_changes_{timestamp}.json"
+    with open(path, "w") as f:
+        json.dump({"baseline": baseline.name, "programs": delta}, f, indent=2, default=str)
+    console.print(f"[green]Exported coach changes for {len(delta)} programs to {path}[/green]")
+    return path
+
+
+def display_delta(delta: list[dict]):
+    """Show a one-line-per-change table of the delta report."""
+    table = Table(title=f"Coach changes since last export ({len(delta)} programs)")
+    table.add_column("University", style="cyan")
+    table.add_column("Gender")
+    table.add_column("Change")
+    table.add_column("Coach", style="green")
+    table.add_column("Email")
+
+    styles = {"added": "green", "removed": "red", "email_changed": "yellow"}
+    for program in delta:
+        for change in program["changes"]:
+            email = change["email"] or "-"
+            if change["change"] == "email_changed":
+                email = f"{change['old_email'] or '-'} → {email}"
+            table.add_row(
+                program["university"],
+                program["gender"],
+                f"[{styles[change['change']]}]{change['change']}[/]",
+                change["name"],
+                email,
+            )
+
+    console.print(table)
@@ -0,0 +1,92 @@
+"""Append-only JSONL checkpoint journal for batch runs."""
+
+import json
+import os
+from pathlib import Path
+
+from .models import Gender, ProgramRecord
+
+
+ProgramKey = tuple[str, Gender]
+
+
+class CheckpointJournal:
+    """One JSON line per completed program or error, fsync'd as it is written.
+
+    A checkpoint therefore costs one small append no matter how far into the
+    run we are, and a crash loses at most the line being written. Records are
+    identified by (school, gender); when a key appears more than once the last
+    record wins. ``compact`` rewrites the journal with one record per key.
+    """
+
+    def __init__(self, path: Path):
+        self.path = path
+        self.file = None
+
+    def open(self, truncate: bool = False):
+        self.file = open(self.path, "w" if truncate else "a", encoding="utf-8")
+        if not truncate and self.file.tell() > 0:
+            # Start on a fresh line in case the last write was torn
+            with open(self.path, "rb") as f:
+                f.seek(-1, os.SEEK_END)
+                if f.read(1) != b"\n":
+                    self.file.write("\n")
+
+    def close(self):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def load(self) -> tuple[dict[ProgramKey, ProgramRecord], dict[ProgramKey, dict]]:
+        """Replay the journal into completed programs and errors, keyed by (school, gender).
+
+        The journal is our own output, so programs are loaded as trusted
+        records without revalidation.
+        """
+        programs: dict[ProgramKey, ProgramRecord] = {}
+        errors: dict[ProgramKey, dict] = {}
+        if not self.path.exists():
+            return programs, errors
+
+        with open(self.path, encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError:
+                    # Torn final line from a crash mid-write
+                    continue
+                if record["type"] == "program":
+                    program = ProgramRecord.from_dict(record["program"])
+                    key = (program.university, program.gender)
+                    programs[key] = program
+                    errors.pop(key, None)
+                else:
+                    error = record["error"]
+                    key = (error["school"], Gender(error["gender"]))
+                    errors[key] = error
+                    programs.pop(key, None)
+        return programs, errors
+
+    def append(self, record: dict):
+        self.file.write(json.dumps(record, default=str) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+
+    def append_program(self, program: ProgramRecord):
+        self.append({"type": "program", "program": program.to_dict()})
+
+    def append_error(self, error: dict):
+        self.append({"type": "error", "error": error})
+
+    def compact(self, programs: list[ProgramRecord], errors: list[dict]):
+        """Atomically replace the journal with exactly these records."""
+        self.close()
+        tmp = self.path.with_suffix(".tmp")
+        with open(tmp, "w", encoding="utf-8") as f:
+            for program in programs:
+                f.write(json.dumps({"type": "program", "program": program.to_dict()}) + "\n")
+            for error in errors:
+                f.write(json.dumps({"type": "error", "error": error}, default=str) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        tmp.replace(self.path)
@@ -1,15 +1,15 @@
 """Main entry point for tennis scraper."""
 
 import asyncio
-import csv
-import json
 from datetime import datetime
 from pathlib import Path
+from typing import Iterable
 
 from rich.console import Console
 from rich.table import Table
 
-from .models import Division, Gender, TennisProgram
+from .exporters import CsvWriter, JsonArrayWriter, export_programs
+from .models import Division, Gender, ProgramRecord
 from .scraper import TennisScraper
 
 
@@ -68,7 +68,7 @@ SAMPLE_UNIVERSITIES = [
 ]
 
 
-async def scrape_sample_programs() -> list[TennisProgram]:
+async def scrape_sample_programs() -> list[ProgramRecord]:
     """Scrape sample universities for proof-of-concept."""
     programs = []
 
@@ -101,28 +101,20 @@ async def scrape_sample_programs() -> list[TennisProgram]:
     return programs
 
 
-def export_to_json(programs: list[TennisProgram], path: Path):
+def export_to_json(programs: Iterable[ProgramRecord], path: Path):
     """Export programs to JSON."""
-    data = [p.model_dump(mode="json") for p in programs]
-    path.write_text(json.dumps(data, indent=2, default=str))
-    console.print(f"[green]Exported {len(programs)} programs to {path}[/green]")
+    count = export_programs(programs, [JsonArrayWriter(path)])
+    console.print(f"[green]Exported {count} programs to {path}[/green]")
 
 
-def export_to_csv(programs: list[TennisProgram], path: Path):
+def export_to_csv(programs: Iterable[ProgramRecord], path: Path):
     """Export programs to CSV (flattened)."""
-    if not programs:
-        return
+    count = export_programs(programs, [CsvWriter(path)])
+    if count:
+        console.print(f"[green]Exported {count} programs to {path}[/green]")
 
-    rows = [p.to_flat_dict() for p in programs]
-    with open(path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=rows[0].keys())
-        writer.writeheader()
-        writer.writerows(rows)
 
-    console.print(f"[green]Exported {len(programs)} programs to {path}[/green]")
-
-
-def display_results(programs: list[TennisProgram]):
+def display_results(programs: list[ProgramRecord]):
     """Display results in a table."""
     table = Table(title="Tennis Programs Scraped")
 
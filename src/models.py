@@ -1,5 +1,6 @@
 """Data models for tennis program scraper."""
 
+from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 from pydantic import BaseModel, EmailStr, Field
@@ -35,6 +36,8 @@ class TennisProgram(BaseModel):
     assistant_coaches: list[Coach] = Field(default_factory=list)
     athletics_url: str
     tennis_page_url: str | None = None
+    # Hash of the coach fragment the coaches were extracted from, for incremental runs
+    coaches_fingerprint: str | None = None
     scraped_at: datetime = Field(default_factory=datetime.utcnow)
 
     def to_flat_dict(self) -> dict:
@@ -55,3 +58,87 @@ class TennisProgram(BaseModel):
             "tennis_page_url": self.tennis_page_url,
             "scraped_at": self.scraped_at.isoformat(),
         }
+
+
+# Lean records used inside the scraper, the checkpoint journal and the store.
+# They skip validation entirely; ``to_model`` produces the validated pydantic
+# models above, which exports go through.
+
+
+@dataclass(slots=True)
+class CoachRecord:
+    name: str
+    title: str | None = None
+    email: str | None = None
+    phone: str | None = None
+
+    def to_model(self) -> Coach:
+        return Coach(name=self.name, title=self.title, email=self.email, phone=self.phone)
+
+    def to_dict(self) -> dict:
+        return {"name": self.name, "title": self.title, "email": self.email, "phone": self.phone}
+
+
+@dataclass(slots=True)
+class ProgramRecord:
+    university: str
+    state: str
+    division: Division
+    gender: Gender
+    athletics_url: str
+    team_name: str | None = None
+    head_coach: CoachRecord | None = None
+    assistant_coaches: list[CoachRecord] = field(default_factory=list)
+    tennis_page_url: str | None = None
+    coaches_fingerprint: str | None = None
+    scraped_at: datetime = field(default_factory=datetime.utcnow)
+
+    def to_model(self) -> TennisProgram:
+        """Validate into a ``TennisProgram`` at an export boundary."""
+        return TennisProgram(
+            university=self.university,
+            state=self.state,
+            division=self.division,
+            gender=self.gender,
+            team_name=self.team_name,
+            head_coach=self.head_coach.to_model() if self.head_coach else None,
+            assistant_coaches=[c.to_model() for c in self.assistant_coaches],
+            athletics_url=self.athletics_url,
+            tennis_page_url=self.tennis_page_url,
+            coaches_fingerprint=self.coaches_fingerprint,
+            scraped_at=self.scraped_at,
+        )
+
+    def to_dict(self) -> dict:
+        """Same shape as ``TennisProgram.model_dump(mode="json")``."""
+        return {
+            "university": self.university,
+            "state": self.state,
+            "division": self.division.value,
+            "gender": self.gender.value,
+            "team_name": self.team_name,
+            "head_coach": self.head_coach.to_dict() if self.head_coach else None,
+            "assistant_coaches": [c.to_dict() for c in self.assistant_coaches],
+            "athletics_url": self.athletics_url,
+            "tennis_page_url": self.tennis_page_url,
+            "coaches_fingerprint": self.coaches_fingerprint,
+            "scraped_at": self.scraped_at.isoformat(),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ProgramRecord":
+        """Trusted load of data we wrote ourselves (journal, exports), without validation."""
+        head = data.get("head_coach")
+        return cls(
+            university=data["university"],
+            state=data["state"],
+            division=Division(data["division"]),
+            gender=Gender(data["gender"]),
+            team_name=data.get("team_name"),
+            head_coach=CoachRecord(**head) if head else None,
+            assistant_coaches=[CoachRecord(**c) for c in data.get("assistant_coaches", [])],
+            athletics_url=data["athletics_url"],
+            tennis_page_url=data.get("tennis_page_url"),
+            coaches_fingerprint=data.get("coaches_fingerprint"),
+            scraped_at=datetime.fromisoformat(data["scraped_at"]),
+        )
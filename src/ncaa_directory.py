@@ -10,6 +10,7 @@ from rich.console import Console
 from rich.progress import Progress, SpinnerColumn, TextColumn
 
 from .models import Division
+from .waits import wait_until_ready
 
 console = Console()
 
@@ -35,10 +36,10 @@ async def scrape_ncaa_directory() -> list[dict]:
 
                 try:
                     await page.goto(url, timeout=60000)
-                    await asyncio.sleep(3)
 
-                    # Wait for table to load
+                    # Wait for table to load, then for rows to stop streaming in
                     await page.wait_for_selector("table tbody tr", timeout=15000)
+                    await wait_until_ready(page, markers=None, timeout=5000)
 
                     # Extract school data from table
                     rows = await page.query_selector_all("table tbody tr")
@@ -90,7 +91,7 @@ async def scrape_ncaa_school_athletics_url(ncaa_url: str, page) -> str | None:
     """From an NCAA school page, find the athletics website URL."""
     try:
         await page.goto(f"https://web3.ncaa.org{ncaa_url}", timeout=30000)
-        await asyncio.sleep(2)
+        await wait_until_ready(page, markers=None)
 
         # Look for athletics website link
         links = await page.query_selector_all("a")
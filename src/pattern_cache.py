@@ -0,0 +1,123 @@
+"""Persistent per-domain cache of which URL patterns work on each athletics site."""
+
+import sqlite3
+import time
+from pathlib import Path
+from urllib.parse import urlsplit
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS url_patterns (
+    domain TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    pattern TEXT NOT NULL,
+    slot INTEGER NOT NULL,
+    ok INTEGER NOT NULL,
+    checked_at REAL NOT NULL,
+    -- Where a hit landed after redirects, if somewhere else
+    resolved_url TEXT,
+    PRIMARY KEY (domain, kind, pattern)
+)
+"""
+
+
+def split_url(url: str) -> tuple[str, str]:
+    """Split a URL into (domain, pattern), where pattern is everything after the host."""
+    parts = urlsplit(url)
+    return parts.netloc.lower(), parts._replace(scheme="", netloc="").geturl()
+
+
+class PatternCache:
+    """SQLite-backed record of winning and failed URL patterns per domain.
+
+    Candidates for a ``kind`` ("sport", "coaches", "roster") are ordered lists
+    and the same slot means the same pattern for men's and women's programs
+    (e.g. ``/sports/mens-tennis`` and ``/sports/womens-tennis``). Winners are
+    therefore remembered by slot so they carry over to the other gender,
+    while failures are remembered by the concrete pattern and expire after
+    ``failure_ttl`` seconds. Callers should only record definite misses
+    (404/410, soft 404s), never timeouts or blocks, since a miss replaces
+    the pattern's winning row. Hits also keep the URL they resolved to, so
+    replay lands on the same page the live run did.
+    """
+
+    def __init__(self, path: Path, failure_ttl: float = 7 * 24 * 3600):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute(SCHEMA)
+        columns = {row[1] for row in self.conn.execute("PRAGMA table_info(url_patterns)")}
+        if "resolved_url" not in columns:
+            # Caches written before redirect targets were recorded
+            self.conn.execute("ALTER TABLE url_patterns ADD COLUMN resolved_url TEXT")
+        self.conn.commit()
+        self.failure_ttl = failure_ttl
+
+    def close(self):
+        self.conn.close()
+
+    def winner(self, domain: str, kind: str) -> int | None:
+        """Slot of the most recently successful pattern for this domain."""
+        row = self.conn.execute(
+            "SELECT slot FROM url_patterns WHERE domain = ? AND kind = ? AND ok = 1 "
+            "ORDER BY checked_at DESC LIMIT 1",
+            (domain, kind),
+        ).fetchone()
+        return row[0] if row else None
+
+    def failures(self, domain: str, kind: str) -> set[str]:
+        """Patterns that failed within the TTL."""
+        rows = self.conn.execute(
+            "SELECT pattern FROM url_patterns WHERE domain = ? AND kind = ? AND ok = 0 AND checked_at > ?",
+            (domain, kind, time.time() - self.failure_ttl),
+        )
+        return {r[0] for r in rows}
+
+    def order(self, kind: str, urls: list[str | None]) -> list[int]:
+        """Indices of ``urls`` to try: cached winner first, recent failures last.
+
+        ``None`` entries mark slots that don't apply to this site and are skipped.
+        """
+        present = [url for url in urls if url]
+        if not present:
+            return []
+        domain = split_url(present[0])[0]
+        failed = self.failures(domain, kind)
+        slots = [i for i, url in enumerate(urls) if url and split_url(url)[1] not in failed]
+        # Still tried, in case the page has come back, but only after everything else
+        retries = [i for i, url in enumerate(urls) if url and split_url(url)[1] in failed]
+
+        winner = self.winner(domain, kind)
+        if winner in slots:
+            slots.remove(winner)
+            slots.insert(0, winner)
+        return slots + retries
+
+    def lookup(self, url: str) -> bool | None:
+        """Last recorded outcome for this exact URL under any kind, ignoring the TTL."""
+        domain, pattern = split_url(url)
+        row = self.conn.execute(
+            "SELECT ok FROM url_patterns WHERE domain = ? AND pattern = ? ORDER BY checked_at DESC LIMIT 1",
+            (domain, pattern),
+        ).fetchone()
+        return bool(row[0]) if row else None
+
+    def resolved_url(self, url: str) -> str | None:
+        """Where the last recorded hit for this exact URL landed, if it was redirected."""
+        domain, pattern = split_url(url)
+        row = self.conn.execute(
+            "SELECT resolved_url FROM url_patterns WHERE domain = ? AND pattern = ? AND ok = 1 "
+            "ORDER BY checked_at DESC LIMIT 1",
+            (domain, pattern),
+        ).fetchone()
+        return row[0] if row else None
+
+    def record(self, kind: str, slot: int, url: str, ok: bool, resolved_url: str | None = None):
+        """Remember whether the pattern at ``slot`` worked for this URL, and where a hit landed."""
+        domain, pattern = split_url(url)
+        redirected_to = resolved_url if resolved_url != url else None
+        self.conn.execute(
+            "INSERT OR REPLACE INTO url_patterns (domain, kind, pattern, slot, ok, checked_at, resolved_url) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (domain, kind, pattern, slot, int(ok), time.time(), redirected_to),
+        )
+        self.conn.commit()
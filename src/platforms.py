@@ -0,0 +1,132 @@
+"""Fingerprinting of the vendor CMS platform behind an athletics site."""
+
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Mapping
+
+
+# Stored for domains that were fetched but matched no signature, so they
+# aren't fetched again until the entry expires
+UNKNOWN_PLATFORM = "unknown"
+
+# Lowercase substrings that identify a platform, by where they are looked for:
+# response header values, the generator meta tag, and script/stylesheet/image
+# URLs on the home page. Platforms are checked in order.
+PLATFORM_SIGNATURES: dict[str, dict[str, tuple[str, ...]]] = {
+    "sidearm": {
+        "headers": ("sidearm",),
+        "generator": ("sidearm",),
+        "assets": ("sidearmsports.com", "sidearm.nextgen", "sidearm.sites", "/sidearm"),
+    },
+    "prestosports": {
+        "headers": ("presto",),
+        "generator": ("prestosports", "presto sports"),
+        "assets": ("prestosports.com", "/_presto/", "presto-sports"),
+    },
+    "wmt": {
+        "headers": ("wmt",),
+        "generator": ("wmt digital", "wmt.digital"),
+        "assets": ("wmt.digital", "wmtdigital", "/wmt-"),
+    },
+}
+
+# Response headers whose values name the server stack
+FINGERPRINT_HEADERS = ("server", "x-powered-by", "x-generator", "x-platform")
+
+GENERATOR_RE = re.compile(
+    r"""<meta[^>]+name=["']generator["'][^>]*content=["']([^"']*)["']"""
+    r"""|<meta[^>]+content=["']([^"']*)["'][^>]*name=["']generator["']""",
+    re.IGNORECASE,
+)
+ASSET_RE = re.compile(r"""<(?:script|link|img)\b[^>]*?(?:src|href)=["']([^"']+)["']""", re.IGNORECASE)
+
+
+def detect_platform(headers: Mapping[str, str], html: str) -> str | None:
+    """Name of the platform a home page was served by, or None if unrecognized.
+
+    Only the response headers and a regex scan of the markup are used, so
+    this is cheap enough to run on the event loop.
+    """
+    header_values = " ".join(headers.get(name, "") for name in FINGERPRINT_HEADERS).lower()
+    generator = " ".join(a or b for a, b in GENERATOR_RE.findall(html)).lower()
+    assets = " ".join(ASSET_RE.findall(html)).lower()
+
+    for platform, signature in PLATFORM_SIGNATURES.items():
+        if (
+            any(marker in header_values for marker in signature["headers"]) or
+            any(marker in generator for marker in signature["generator"]) or
+            any(marker in assets for marker in signature["assets"])
+        ):
+            return platform
+    return None
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS platforms (
+    domain TEXT PRIMARY KEY,
+    platform TEXT NOT NULL,
+    checked_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS fetch_tiers (
+    domain TEXT PRIMARY KEY,
+    tier TEXT NOT NULL,
+    checked_at REAL NOT NULL
+);
+"""
+
+# How a domain's coaches pages are fetched: plain HTTP, or rendered in Chromium
+STATIC_TIER = "static"
+BROWSER_TIER = "browser"
+
+
+class PlatformCache:
+    """SQLite record of each athletics domain's platform and fetch tier.
+
+    Sites rarely change platform, so entries are trusted for ``ttl`` seconds
+    and a domain is fingerprinted at most once in that window. The fetch
+    tier is the cheapest way coaches pages were last fetched successfully,
+    and expires the same way so sites that stop needing the browser are
+    eventually retried statically.
+    """
+
+    def __init__(self, path: Path, ttl: float = 30 * 24 * 3600):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+        self.ttl = ttl
+
+    def close(self):
+        self.conn.close()
+
+    def get(self, domain: str) -> str | None:
+        """Cached platform (possibly ``UNKNOWN_PLATFORM``), or None if not fingerprinted recently."""
+        row = self.conn.execute(
+            "SELECT platform FROM platforms WHERE domain = ? AND checked_at > ?",
+            (domain, time.time() - self.ttl),
+        ).fetchone()
+        return row[0] if row else None
+
+    def put(self, domain: str, platform: str):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO platforms (domain, platform, checked_at) VALUES (?, ?, ?)",
+            (domain, platform, time.time()),
+        )
+        self.conn.commit()
+
+    def tier(self, domain: str) -> str | None:
+        """Fetch tier that last worked for this domain, if recorded within the TTL."""
+        row = self.conn.execute(
+            "SELECT tier FROM fetch_tiers WHERE domain = ? AND checked_at > ?",
+            (domain, time.time() - self.ttl),
+        ).fetchone()
+        return row[0] if row else None
+
+    def record_tier(self, domain: str, tier: str):
+        self.conn.execute(
+            "INSERT OR REPLACE INTO fetch_tiers (domain, tier, checked_at) VALUES (?, ?, ?)",
+            (domain, tier, time.time()),
+        )
+        self.conn.commit()
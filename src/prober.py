@@ -0,0 +1,223 @@
+"""Lightweight HTTP probing of candidate URLs without a browser."""
+
+import re
+from dataclasses import dataclass, field
+from urllib.parse import urldefrag, urlsplit
+
+import httpx
+
+from .rate_limiter import HostRateLimiter
+
+
+# Present as a regular desktop browser; many athletics CDNs reject default client UAs
+BROWSER_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (X11; Linux x86_64) AppleWebKit/537.36 "
+        "(KHTML, like Gecko) Chrome/124.0 Safari/537.36"
+    ),
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# Servers that don't implement HEAD properly
+HEAD_UNSUPPORTED = {405, 501}
+
+# Statuses that usually mean "not for bots" rather than "not found"
+BLOCKED_STATUSES = {401, 403, 406, 429, 503}
+
+# Statuses that definitely mean "not found"
+MISSING_STATUSES = {404, 410}
+
+# Path words too common to relate a redirect target to the requested page
+GENERIC_PATH_WORDS = {"sports", "sport", "index", "aspx", "html", "php"}
+PATH_WORD_RE = re.compile(r"[a-z0-9]+")
+
+# Sport slugs that name the same page as a spelled-out one but share no word
+# with it (Kentucky and PrestoSports sites use mten/wten)
+SPORT_SLUG_ALIASES = {
+    "mten": "mens-tennis",
+    "wten": "womens-tennis",
+}
+
+
+def path_segments(url: str) -> list[str]:
+    """Lowercase path segments, with sport slug aliases spelled out."""
+    segments = [s for s in urlsplit(url).path.lower().split("/") if s]
+    return [SPORT_SLUG_ALIASES.get(s, s) for s in segments]
+
+
+def is_soft_404(url: str, final_url: str) -> bool:
+    """True if a redirect from ``url`` landed somewhere that isn't that page.
+
+    Sites often answer a missing path by redirecting to the home page or a
+    section index instead of returning 404. A redirect counts as a miss when
+    it lands on an ancestor of the requested path (the home page included),
+    or on a path sharing no specific word with it. Redirects between
+    spellings of the same page (``/sports/m-tennis`` or ``/sports/mten`` to
+    ``/sports/mens-tennis``) still count as found.
+    """
+    requested = path_segments(url)
+    landed = path_segments(final_url)
+    if landed == requested:
+        return False
+    if len(landed) < len(requested) and requested[:len(landed)] == landed:
+        return True
+
+    def words(segments: list[str]) -> set[str]:
+        return {w for s in segments for w in PATH_WORD_RE.findall(s)} - GENERIC_PATH_WORDS
+
+    return not words(requested) & words(landed)
+
+
+@dataclass
+class ProbeResult:
+    """Outcome of probing a single URL."""
+
+    url: str
+    status: int | None = None
+    final_url: str | None = None
+    redirects: list[str] = field(default_factory=list)
+    # True when the probe was inconclusive and a real browser should decide
+    needs_browser: bool = False
+    # Redirected to the home page or an unrelated page (see is_soft_404)
+    soft_404: bool = False
+
+    @property
+    def exists(self) -> bool:
+        return self.status == 200 and not self.soft_404
+
+    @property
+    def missing(self) -> bool:
+        """Definitely not there, as opposed to inconclusive (timeout, 5xx, blocked)."""
+        return self.status in MISSING_STATUSES or self.soft_404
+
+    @property
+    def conclusive(self) -> bool:
+        return self.exists or self.missing
+
+    @property
+    def resolved_url(self) -> str:
+        """Where the page actually lives, after redirects, keeping the requested fragment."""
+        if not self.final_url:
+            return self.url
+        final = urldefrag(self.final_url).url
+        fragment = urlsplit(self.url).fragment
+        return f"{final}#{fragment}" if fragment else final
+
+    @classmethod
+    def landed(cls, url: str, status: int, final_url: str, redirects: list[str] | None = None) -> "ProbeResult":
+        """Result for a request that ended at ``final_url`` with ``status``."""
+        return cls(
+            url=url,
+            status=status,
+            final_url=final_url,
+            redirects=redirects or [],
+            needs_browser=status in BLOCKED_STATUSES,
+            soft_404=final_url != url and is_soft_404(url, final_url),
+        )
+
+
+class UrlProber:
+    """Probe URLs with pooled HTTP/2 HEAD/GET requests.
+
+    Probes share one connection pool and the scraper's per-host rate limiter.
+    A result is marked ``needs_browser`` when the site blocks non-browser
+    clients or the request fails outright, so the caller can fall back to a
+    full Playwright page load.
+    """
+
+    def __init__(
+        self,
+        limiter: HostRateLimiter | None = None,
+        timeout: float = 10.0,
+        max_connections: int = 50,
+    ):
+        self.limiter = limiter
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.client: httpx.AsyncClient | None = None
+
+    async def __aenter__(self):
+        self.client = httpx.AsyncClient(
+            http2=True,
+            follow_redirects=True,
+            headers=BROWSER_HEADERS,
+            timeout=self.timeout,
+            limits=httpx.Limits(max_connections=self.max_connections),
+        )
+        return self
+
+    async def __aexit__(self, *args):
+        if self.client:
+            await self.client.aclose()
+
+    async def request(self, method: str, url: str, headers: dict | None = None) -> httpx.Response:
+        """Send a rate-limited request, feeding the status back to the limiter."""
+        if self.limiter:
+            await self.limiter.acquire(url)
+        try:
+            response = await self.client.request(method, url, headers=headers)
+        except httpx.HTTPError:
+            if self.limiter:
+                self.limiter.record(url, None)
+            raise
+        if self.limiter:
+            self.limiter.record(url, response.status_code, response.headers.get("retry-after"))
+        return response
+
+    async def probe(self, url: str) -> ProbeResult:
+        """Probe a URL, following redirects, and report its final status."""
+        try:
+            response = await self.request("HEAD", url)
+            if response.status_code in HEAD_UNSUPPORTED:
+                response = await self.request("GET", url)
+        except httpx.HTTPError:
+            return ProbeResult(url=url, needs_browser=True)
+
+        return ProbeResult.landed(
+            url,
+            response.status_code,
+            str(response.url),
+            [str(r.url) for r in response.history],
+        )
+
+    async def fetch(self, url: str) -> httpx.Response | None:
+        """GET a page's static HTML, or None if the request fails or is blocked."""
+        try:
+            response = await self.request("GET", url)
+        except httpx.HTTPError:
+            return None
+        if response.status_code in BLOCKED_STATUSES:
+            return None
+        return response
+
+    async def revalidate(self, url: str, etag: str | None, last_modified: str | None) -> bool:
+        """Check whether a cached copy of ``url`` is still current.
+
+        Sends a conditional HEAD (falling back to GET) with the cached
+        validators. A 304, or a 200 carrying the same validators, counts as
+        unchanged.
+        """
+        if not etag and not last_modified:
+            return False
+
+        headers = {}
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+        try:
+            response = await self.request("HEAD", url, headers=headers)
+            if response.status_code in HEAD_UNSUPPORTED:
+                response = await self.request("GET", url, headers=headers)
+        except httpx.HTTPError:
+            return False
+
+        if response.status_code == 304:
+            return True
+        if response.status_code != 200:
+            return False
+        if etag:
+            return response.headers.get("etag") == etag
+        return response.headers.get("last-modified") == last_modified
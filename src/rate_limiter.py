@@ -0,0 +1,91 @@
+"""Per-host token-bucket rate limiting with adaptive backoff."""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+
+# Status codes that mean the host wants us to slow down
+BACKOFF_STATUSES = {429, 503}
+
+
+@dataclass
+class TokenBucket:
+    """Token bucket state for a single host."""
+
+    rate: float
+    burst: int
+    tokens: float
+    updated: float = field(default_factory=time.monotonic)
+    backoff: float = 0.0
+    blocked_until: float = 0.0
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+    def refill(self, now: float):
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+
+class HostRateLimiter:
+    """Rate limiter keyed by hostname.
+
+    Each host gets its own bucket refilled at ``rate`` requests per second with
+    up to ``burst`` requests allowed back to back. A 429/503 response puts the
+    host into exponential backoff (honouring Retry-After when given), which
+    decays again as successful responses come in.
+    """
+
+    def __init__(self, rate: float = 1.0, burst: int = 2, max_backoff: float = 60.0):
+        self.rate = rate
+        self.burst = burst
+        self.max_backoff = max_backoff
+        self.buckets: dict[str, TokenBucket] = {}
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        return urlparse(url).netloc.lower()
+
+    def bucket(self, url: str) -> TokenBucket:
+        host = self.host_of(url)
+        if host not in self.buckets:
+            self.buckets[host] = TokenBucket(rate=self.rate, burst=self.burst, tokens=self.burst)
+        return self.buckets[host]
+
+    async def acquire(self, url: str):
+        """Wait until a request to the URL's host is allowed."""
+        if self.rate <= 0:
+            return
+
+        bucket = self.bucket(url)
+        # Serialize waiters per host so tokens are handed out in arrival order
+        async with bucket.lock:
+            while True:
+                now = time.monotonic()
+                bucket.refill(now)
+
+                wait = bucket.blocked_until - now
+                if wait <= 0 and bucket.tokens >= 1:
+                    bucket.tokens -= 1
+                    return
+                if wait <= 0:
+                    wait = (1 - bucket.tokens) / bucket.rate
+
+                await asyncio.sleep(wait)
+
+    def record(self, url: str, status: int | None, retry_after: str | None = None):
+        """Feed a response status back into the host's backoff state."""
+        bucket = self.bucket(url)
+
+        if status in BACKOFF_STATUSES:
+            bucket.backoff = min(self.max_backoff, max(bucket.backoff * 2, 1 / self.rate if self.rate else 1.0))
+            delay = bucket.backoff
+            if retry_after and retry_after.strip().isdigit():
+                delay = min(self.max_backoff, max(delay, float(retry_after)))
+            bucket.blocked_until = time.monotonic() + delay
+            # Drop any accumulated burst so we resume one request at a time
+            bucket.tokens = 0
+        elif status is not None and bucket.backoff:
+            bucket.backoff /= 2
+            if bucket.backoff < 0.5:
+                bucket.backoff = 0.0
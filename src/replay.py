@@ -0,0 +1,198 @@
+"""Offline replay of the scraper against cached HTML, for tuning the parsers."""
+
+import asyncio
+import json
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from .batch_scraper import display_summary
+from .exporters import JsonArrayWriter, export_programs
+from .html_cache import HtmlCache
+from .models import Gender, ProgramRecord
+from .pattern_cache import PatternCache
+from .prober import ProbeResult
+from .platforms import PlatformCache
+from .schools_data import get_all_schools
+from .scraper import TennisScraper
+
+
+console = Console()
+
+
+class ReplayScraper(TennisScraper):
+    """TennisScraper that never touches the network.
+
+    URL existence comes from the outcomes recorded in the pattern cache,
+    platforms from the platform cache and page HTML from the HTML cache,
+    regardless of age. Anything the
+    snapshot corpus doesn't contain is treated as missing, exactly as a
+    failed fetch would be. The full ``scrape_program`` decision tree and
+    parsers run unchanged.
+    """
+
+    def __init__(
+        self,
+        html_cache: Path = Path("data/html_cache"),
+        pattern_cache: Path = Path("data/url_patterns.sqlite"),
+        platform_cache: Path = Path("data/platforms.sqlite"),
+    ):
+        super().__init__(
+            html_cache=html_cache,
+            pattern_cache=pattern_cache,
+            block_resources=None,
+            platform_cache=platform_cache,
+        )
+
+    async def __aenter__(self):
+        self.patterns = PatternCache(self.pattern_cache_path)
+        self.html_cache = HtmlCache(self.html_cache_path)
+        # Any age is fine for replay
+        self.platform_cache = PlatformCache(self.platform_cache_path, ttl=float("inf"))
+        return self
+
+    async def __aexit__(self, *args):
+        self.patterns.close()
+        self.html_cache.close()
+        self.platform_cache.close()
+
+    async def check_url(self, url: str) -> ProbeResult:
+        if self.patterns.lookup(url) is not True:
+            return ProbeResult(url=url, status=404, final_url=url)
+        # Land where the live run did, so later lookups use the same URLs
+        return ProbeResult(url=url, status=200, final_url=self.patterns.resolved_url(url) or url)
+
+    def record_pattern(self, kind: str | None, slot: int, url: str, ok: bool, resolved_url: str | None = None):
+        # The corpus is read-only during replay
+        pass
+
+    def record_tier(self, url: str, tier: str):
+        self.tier_counts[tier] += 1
+
+    async def cached_html(self, url: str, mode: str) -> str | None:
+        cached = self.html_cache.get(url, mode)
+        if not cached and mode == "fragment":
+            # Snapshots taken before fragment extraction hold the full page,
+            # which the coach parsers read identically
+            cached = self.html_cache.get(url, "rendered")
+        return cached.html if cached else None
+
+    async def render_page(self, url: str, wait_for: str | None = None, fragment: bool = False) -> str | None:
+        return None
+
+    async def download_page(self, url: str) -> str | None:
+        return None
+
+    async def classify_site(self, athletics_url: str) -> str | None:
+        return None
+
+    async def render_roster_section(self, roster_urls: list[str | None], slots: list[int]) -> str | None:
+        return None
+
+    async def render_roster_tab(self, roster_url: str) -> str | None:
+        return None
+
+
+async def replay_programs(
+    limit: int | None = None,
+    html_cache: Path = Path("data/html_cache"),
+    pattern_cache: Path = Path("data/url_patterns.sqlite"),
+) -> list[ProgramRecord]:
+    """Run scrape_program for every school against the snapshot corpus."""
+    schools = get_all_schools()
+    if limit:
+        schools = schools[:limit]
+
+    programs: list[ProgramRecord] = []
+    async with ReplayScraper(html_cache=html_cache, pattern_cache=pattern_cache) as scraper:
+        for school in schools:
+            for gender in [Gender.MEN, Gender.WOMEN]:
+                programs.append(await scraper.scrape_program(
+                    university=school["school"],
+                    state=school["state"],
+                    athletics_url=school["athletics_url"],
+                    division=school["division"],
+                    gender=gender,
+                ))
+
+    return programs
+
+
+def coach_summary(program: dict) -> tuple:
+    """The parts of a program a parser change can affect."""
+    head = program.get("head_coach") or {}
+    return (
+        head.get("name"),
+        head.get("email"),
+        tuple((c["name"], c.get("title"), c.get("email")) for c in program.get("assistant_coaches", [])),
+    )
+
+
+def compare_programs(baseline: list[dict], programs: list[ProgramRecord]) -> list[dict]:
+    """Programs whose coaches differ from a previous export."""
+    before = {(p["university"], p["gender"]): p for p in baseline}
+    changes = []
+    for program in programs:
+        after = program.to_dict()
+        key = (after["university"], after["gender"])
+        old = before.get(key)
+        if old is None or coach_summary(old) != coach_summary(after):
+            changes.append({"university": key[0], "gender": key[1], "before": old, "after": after})
+    return changes
+
+
+def display_changes(changes: list[dict]):
+    """Show head coach changes relative to the baseline."""
+    table = Table(title=f"Programs changed vs baseline ({len(changes)})")
+    table.add_column("University", style="cyan")
+    table.add_column("Gender")
+    table.add_column("Head Coach before")
+    table.add_column("Head Coach after", style="green")
+    table.add_column("Assistants before/after")
+
+    for change in changes:
+        before = change["before"] or {}
+        after = change["after"]
+        table.add_row(
+            change["university"],
+            change["gender"],
+            (before.get("head_coach") or {}).get("name") or "-",
+            (after.get("head_coach") or {}).get("name") or "-",
+            f"{len(before.get('assistant_coaches', []))}/{len(after['assistant_coaches'])}",
+        )
+
+    console.print(table)
+
+
+async def main():
+    """Replay the scraper offline."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Re-run coach extraction against cached HTML")
+    parser.add_argument("--limit", type=int, help="Limit number of schools to replay")
+    parser.add_argument("--html-cache", type=Path, default=Path("data/html_cache"))
+    parser.add_argument("--pattern-cache", type=Path, default=Path("data/url_patterns.sqlite"))
+    parser.add_argument("--compare", type=Path, help="Previous all_tennis_programs_*.json to diff against")
+    parser.add_argument("--output", type=Path, help="Write replayed programs to this JSON file")
+    args = parser.parse_args()
+
+    programs = await replay_programs(
+        limit=args.limit,
+        html_cache=args.html_cache,
+        pattern_cache=args.pattern_cache,
+    )
+
+    display_summary(programs, [])
+
+    if args.compare:
+        baseline = json.loads(args.compare.read_text())
+        display_changes(compare_programs(baseline, programs))
+
+    if args.output:
+        export_programs(programs, [JsonArrayWriter(args.output)])
+        console.print(f"[green]Wrote {len(programs)} replayed programs to {args.output}[/green]")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
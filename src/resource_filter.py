@@ -0,0 +1,129 @@
+"""Request interception for Playwright pages: block heavy resources and account traffic."""
+
+import time
+from dataclasses import dataclass, field
+from urllib.parse import urlparse
+
+from playwright.async_api import Page, Request, Route
+
+
+# Coach extraction only needs the DOM, so media and fonts are pure overhead
+DEFAULT_BLOCKED_TYPES = frozenset({"image", "media", "font"})
+
+# Analytics, ad and social embeds commonly served by athletics sites
+DEFAULT_BLOCKED_DOMAINS = frozenset({
+    "google-analytics.com",
+    "googletagmanager.com",
+    "googlesyndication.com",
+    "googleadservices.com",
+    "doubleclick.net",
+    "adservice.google.com",
+    "amazon-adsystem.com",
+    "adsrvr.org",
+    "adnxs.com",
+    "taboola.com",
+    "outbrain.com",
+    "scorecardresearch.com",
+    "quantserve.com",
+    "hotjar.com",
+    "connect.facebook.net",
+    "platform.twitter.com",
+    "cdn.syndication.twimg.com",
+    "instagram.com",
+    "youtube.com",
+    "ytimg.com",
+})
+
+
+@dataclass(frozen=True)
+class BlockConfig:
+    """Which requests to abort, by Playwright resource type and by domain suffix."""
+
+    resource_types: frozenset[str] = DEFAULT_BLOCKED_TYPES
+    domains: frozenset[str] = DEFAULT_BLOCKED_DOMAINS
+
+    def blocks(self, resource_type: str, url: str) -> bool:
+        # Never block the page itself
+        if resource_type == "document":
+            return False
+        if resource_type in self.resource_types:
+            return True
+        host = urlparse(url).hostname or ""
+        return any(host == d or host.endswith("." + d) for d in self.domains)
+
+
+# Accounts traffic without blocking anything, as the baseline to measure the
+# saving of a blocking run against
+BLOCK_NOTHING = BlockConfig(resource_types=frozenset(), domains=frozenset())
+
+
+@dataclass
+class FetchStats:
+    """Traffic accounting for one navigation."""
+
+    url: str
+    started: float = field(default_factory=time.monotonic)
+    requests: int = 0
+    blocked: int = 0
+    bytes: int = 0
+    # Seconds from navigation start until the last subresource finished
+    elapsed: float = 0.0
+
+
+class ResourceFilter:
+    """Install request interception on pages and keep per-navigation traffic stats."""
+
+    def __init__(self, config: BlockConfig | None = None):
+        self.config = config or BlockConfig()
+        # One entry per navigation, so re-rendering a URL adds to the totals
+        self.navigations: list[FetchStats] = []
+        self.current: dict[Page, FetchStats] = {}
+
+    async def install(self, page: Page):
+        """Route all of a page's requests through the filter."""
+
+        async def handle(route: Route):
+            request = route.request
+            stats = self.current.get(page)
+            if self.config.blocks(request.resource_type, request.url):
+                if stats:
+                    stats.blocked += 1
+                await route.abort()
+            else:
+                await route.continue_()
+
+        async def on_finished(request: Request):
+            stats = self.current.get(page)
+            if not stats:
+                return
+            try:
+                sizes = await request.sizes()
+            except Exception:
+                return
+            stats.requests += 1
+            stats.bytes += sizes["responseBodySize"] + sizes["responseHeadersSize"]
+            stats.elapsed = time.monotonic() - stats.started
+
+        def on_close(_):
+            self.current.pop(page, None)
+
+        await page.route("**/*", handle)
+        page.on("requestfinished", on_finished)
+        page.on("close", on_close)
+
+    def begin(self, page: Page, url: str) -> FetchStats:
+        """Start accounting a navigation of ``page`` to ``url``."""
+        stats = FetchStats(url=url)
+        self.navigations.append(stats)
+        self.current[page] = stats
+        return stats
+
+    def totals(self) -> dict[str, float]:
+        """Aggregate traffic and load time over every navigation so far."""
+        return {
+            "pages": len(self.navigations),
+            "requests": sum(s.requests for s in self.navigations),
+            "blocked": sum(s.blocked for s in self.navigations),
+            "bytes": sum(s.bytes for s in self.navigations),
+            "seconds": sum(s.elapsed for s in self.navigations),
+        }
@@ -1,669 +1,656 @@
 """Core scraping logic for tennis programs with headless browser support."""
 
 import asyncio
-import re
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
-from playwright.async_api import async_playwright, Browser, Page
-
-from .models import Coach, Division, Gender, TennisProgram
-
-
-def extract_email_from_mailto(href: str) -> str | None:
-    """Extract email from a mailto: href."""
-    if not href or "mailto:" not in href.lower():
-        return None
-    email = href.lower().replace("mailto:", "").split("?")[0].strip()
-    if "@" in email and "." in email.split("@")[1]:
-        return email
-    return None
-
-
-def extract_phone_from_tel(href: str) -> str | None:
-    """Extract phone from a tel: href."""
-    if not href or "tel:" not in href.lower():
-        return None
-    return href.replace("tel:", "").strip()
-
-
-def looks_like_person_name(text: str) -> bool:
-    """Check if text looks like a person's name."""
-    if not text or len(text) < 3 or len(text) > 60:
-        return False
-
-    skip_patterns = [
-        "head coach", "assistant", "volunteer", "director", "coach",
-        "read more", "view bio", "click", "loading", "staff",
-        "email", "phone", "office", "fax", "schedule", "roster",
-        "news", "tickets", "donate", "contact", "twitter", "instagram",
-        "facebook", "youtube", "tiktok", "print", "share",
-    ]
-    lower = text.lower()
-    if any(p in lower for p in skip_patterns):
-        return False
-
-    words = text.split()
-    if len(words) < 2:
-        return False
-
-    if not all(w[0].isupper() for w in words if w):
-        return False
-
-    return True
+from playwright.async_api import async_playwright, Page
+
+from .browser_pool import PagePool
+from .directory import DepartmentDirectory, index_directory_plain
+from .extraction import (
+    coaches_from_plain,
+    get_parser_backend,
+    parse_coaches_plain,
+    parse_roster_coaches_plain,
+)
+from .fragments import extract_coach_fragment, fingerprint_fragment, fingerprint_static_page
+from .html_cache import HtmlCache
+from .models import CoachRecord, Division, Gender, ProgramRecord
+from .pattern_cache import PatternCache
+from .platforms import BROWSER_TIER, STATIC_TIER, UNKNOWN_PLATFORM, PlatformCache, detect_platform
+from .prober import BLOCKED_STATUSES, ProbeResult, UrlProber
+from .rate_limiter import HostRateLimiter
+from .resource_filter import BlockConfig, ResourceFilter
+from .single_flight import SingleFlight
+from .site_adapters import DEFAULT_ADAPTER, AdapterRegistry, SiteAdapter, default_registry, normalize_domain
+from .waits import COACH_MARKERS, wait_until_ready
+
+
+def renders_more(
+    rendered: tuple[CoachRecord | None, list[CoachRecord], str | None],
+    static: tuple[CoachRecord | None, list[CoachRecord], str | None],
+) -> bool:
+    """Whether a rendered coaches page found a head coach or more coaches than the static one."""
+    def coach_count(result) -> int:
+        head_coach, assistants, _ = result
+        return (head_coach is not None) + len(assistants)
+
+    if rendered[0] and not static[0]:
+        return True
+    return coach_count(rendered) > coach_count(static)
 
 
 class TennisScraper:
-    def __init__(self, rate_limit: float = 1.5):
+    def __init__(
+        self,
+        rate_limit: float = 1.5,
+        burst: int = 2,
+        pattern_cache: Path | None = Path("data/url_patterns.sqlite"),
+        pool_size: int = 8,
+        max_page_navigations: int = 50,
+        block_resources: BlockConfig | None = BlockConfig(),
+        html_cache: Path | None = Path("data/html_cache"),
+        cache_max_age: float = 7 * 24 * 3600,
+        parser_backend: str = "lxml",
+        parse_executor: str = "process",
+        parse_workers: int | None = None,
+        adapters: AdapterRegistry | None = None,
+        platform_cache: Path | None = Path("data/platforms.sqlite"),
+    ):
+        # rate_limit is the sustained delay between requests to the same host
         self.rate_limit = rate_limit
-        self.browser: Browser | None = None
+        self.limiter = HostRateLimiter(rate=1 / rate_limit if rate_limit > 0 else 0, burst=burst)
+        self.prober = UrlProber(limiter=self.limiter)
+        self.pattern_cache_path = pattern_cache
+        self.patterns: PatternCache | None = None
+        self.pool_size = pool_size
+        self.max_page_navigations = max_page_navigations
+        # "lxml" is the fast native backend, "soup" the BeautifulSoup reference
+        self.parser = get_parser_backend(parser_backend)
+        # "process", "thread" or "inline"; parsing is CPU-bound, so keep it off the loop
+        self.parse_executor = parse_executor
+        self.parse_workers = parse_workers
+        self.parse_pool: Executor | None = None
+        self.html_cache_path = html_cache
+        self.cache_max_age = cache_max_age
+        self.html_cache: HtmlCache | None = None
+        self.pool: PagePool | None = None
+        # Pass block_resources=None to load pages with every subresource
+        self.resource_filter = ResourceFilter(block_resources) if block_resources else None
         self.playwright = None
+        # Coach pages whose fingerprint matched the previous run
+        self.unchanged_pages = 0
+        # Coach pages fetched this run, by the tier that produced them
+        self.tier_counts: Counter[str] = Counter()
+        # Coalesces identical fetches and parses within this run (e.g. pages
+        # shared by the men's and women's programs)
+        self.flights = SingleFlight()
+        self.adapters = adapters or default_registry()
+        self.platform_cache_path = platform_cache
+        self.platform_cache: PlatformCache | None = None
 
     async def __aenter__(self):
+        if self.pattern_cache_path:
+            self.patterns = PatternCache(self.pattern_cache_path)
+        if self.html_cache_path:
+            self.html_cache = HtmlCache(self.html_cache_path, max_age=self.cache_max_age)
+        if self.platform_cache_path:
+            self.platform_cache = PlatformCache(self.platform_cache_path)
+        if self.parse_executor == "process":
+            self.parse_pool = ProcessPoolExecutor(max_workers=self.parse_workers)
+        elif self.parse_executor == "thread":
+            self.parse_pool = ThreadPoolExecutor(max_workers=self.parse_workers)
+        await self.prober.__aenter__()
         self.playwright = await async_playwright().start()
-        self.browser = await self.playwright.chromium.launch(headless=True)
+        self.pool = PagePool(
+            self.playwright.chromium,
+            size=self.pool_size,
+            max_navigations=self.max_page_navigations,
+            on_new_page=self.resource_filter.install if self.resource_filter else None,
+        )
+        await self.pool.start()
         return self
 
     async def __aexit__(self, *args):
-        if self.browser:
-            await self.browser.close()
+        await self.prober.__aexit__(*args)
+        if self.patterns:
+            self.patterns.close()
+        if self.html_cache:
+            self.html_cache.close()
+        if self.platform_cache:
+            self.platform_cache.close()
+        if self.parse_pool:
+            self.parse_pool.shutdown(cancel_futures=True)
+        if self.pool:
+            await self.pool.close()
         if self.playwright:
             await self.playwright.stop()
 
-    async def fetch_with_js(self, url: str, wait_for: str | None = None) -> str | None:
-        """Fetch a URL using headless browser, waiting for JS to render."""
-        await asyncio.sleep(self.rate_limit)
-        page: Page | None = None
+    async def goto(self, page: Page, url: str, timeout: int = 30000):
+        """Navigate a page to a URL under the per-host rate limit."""
+        await self.limiter.acquire(url)
+        if self.resource_filter:
+            self.resource_filter.begin(page, url)
         try:
-            page = await self.browser.new_page()
-            await page.goto(url, timeout=30000)
+            response = await page.goto(url, timeout=timeout)
+        except Exception:
+            self.limiter.record(url, None)
+            raise
+        if response is not None:
+            self.limiter.record(url, response.status, response.headers.get("retry-after"))
+        return response
+
+    async def cached_html(self, url: str, mode: str) -> str | None:
+        """Serve HTML from the cache if it is fresh or revalidates as unchanged."""
+        if not self.html_cache:
+            return None
+        cached = self.html_cache.get(url, mode)
+        if not cached:
+            return None
+        if cached.fresh:
+            return cached.html
+        if await self.prober.revalidate(url, cached.etag, cached.last_modified):
+            self.html_cache.touch(url, mode)
+            return cached.html
+        return None
 
-            # Wait for content to load
-            if wait_for:
-                try:
-                    await page.wait_for_selector(wait_for, timeout=5000)
-                except:
-                    pass
-            else:
-                # Wait for network to be mostly idle
-                await page.wait_for_load_state("networkidle", timeout=10000)
+    def cache_html(self, url: str, mode: str, html: str, response=None):
+        """Store fetched HTML along with the response's validators."""
+        if not self.html_cache:
+            return
+        headers = response.headers if response is not None else {}
+        self.html_cache.put(
+            url, mode, html,
+            etag=headers.get("etag"),
+            last_modified=headers.get("last-modified"),
+        )
+
+    async def fetch_with_js(self, url: str, wait_for: str | None = None, fragment: bool = False) -> str | None:
+        """Fetch a URL using headless browser, waiting for JS to render.
+
+        With ``fragment`` only the coach-candidate nodes are serialized (see
+        ``COACH_FRAGMENT_JS``) rather than the whole page, which is all the
+        coach parsers need and a fraction of the size.
+        """
+        html = await self.cached_html(url, "fragment" if fragment else "rendered")
+        if html:
+            return html
+        return await self.flights.run(
+            ("fragment" if fragment else "rendered", url),
+            lambda: self.render_page(url, wait_for, fragment),
+        )
+
+    async def render_page(self, url: str, wait_for: str | None = None, fragment: bool = False) -> str | None:
+        """Render a URL in the browser and cache the resulting HTML."""
+        try:
+            async with self.pool.page() as page:
+                response = await self.goto(page, url)
 
-            # Small additional wait for any final renders
-            await asyncio.sleep(0.5)
+                # Wait for content to load: coach markers or a settled DOM
+                await wait_until_ready(page, wait_for or COACH_MARKERS)
 
-            return await page.content()
+                if fragment:
+                    html = await extract_coach_fragment(page)
+                else:
+                    html = await page.content()
+                # Challenge and error pages would otherwise be served for the full TTL
+                if response is not None and response.status == 200:
+                    self.cache_html(url, "fragment" if fragment else "rendered", html, response)
+                return html
         except Exception as e:
             print(f"  Error fetching {url}: {e}")
             return None
-        finally:
-            if page:
-                await page.close()
 
-    async def check_url_exists(self, url: str) -> bool:
-        """Check if a URL exists (returns 200)."""
-        page: Page | None = None
+    async def fetch_static(self, url: str) -> str | None:
+        """Fetch a URL's HTML over plain HTTP, without the browser."""
+        html = await self.cached_html(url, "static")
+        if html:
+            return html
+        return await self.flights.run(("static", url), lambda: self.download_page(url))
+
+    async def download_page(self, url: str) -> str | None:
+        """GET a URL with the prober's client and cache the body."""
+        response = await self.prober.fetch(url)
+        if response is None or response.status_code != 200:
+            return None
+        html = response.text
+        self.cache_html(url, "static", html, response)
+        return html
+
+    async def site_platform(self, athletics_url: str) -> str | None:
+        """The platform an athletics site runs on, fingerprinted once per domain.
+
+        Concurrent callers (e.g. the men's and women's programs) await the
+        same fingerprint, and results persist in the platform cache.
+        """
+        domain = normalize_domain(athletics_url)
+        return await self.flights.run(
+            ("platform", domain),
+            lambda: self.fingerprint_site(domain, athletics_url),
+            keep=True,
+        )
+
+    async def fingerprint_site(self, domain: str, athletics_url: str) -> str | None:
+        platform = self.platform_cache.get(domain) if self.platform_cache else None
+        if platform is None:
+            platform = await self.classify_site(athletics_url)
+            if platform is None:
+                # Fetch failed; try again next run
+                return None
+            if self.platform_cache:
+                self.platform_cache.put(domain, platform)
+        return None if platform == UNKNOWN_PLATFORM else platform
+
+    def fetch_tier(self, url: str) -> str | None:
+        """Recorded fetch tier for the URL's domain, if any."""
+        if not self.platform_cache:
+            return None
+        return self.platform_cache.tier(normalize_domain(url))
+
+    def record_tier(self, url: str, tier: str):
+        """Remember which fetch tier produced coaches for the URL's domain."""
+        self.tier_counts[tier] += 1
+        if self.platform_cache:
+            self.platform_cache.record_tier(normalize_domain(url), tier)
+
+    async def classify_site(self, athletics_url: str) -> str | None:
+        """Fingerprint a site from its home page's headers and markup.
+
+        Returns ``UNKNOWN_PLATFORM`` when no signature matches and None when
+        the home page couldn't be fetched.
+        """
+        response = await self.prober.fetch(athletics_url)
+        if response is None:
+            return None
+        return detect_platform(response.headers, response.text) or UNKNOWN_PLATFORM
+
+    async def check_url(self, url: str) -> ProbeResult:
+        """Check whether a URL exists, following redirects.
+
+        Uses a cheap HTTP probe first and only loads the URL in the browser
+        when the probe is inconclusive (blocked client, connection error).
+        A redirect to the home page or an unrelated page counts as missing
+        (see ``is_soft_404``); ``final_url`` is where the URL resolved to.
+        """
+        result = await self.prober.probe(url)
+        if not result.needs_browser:
+            return result
+
         try:
-            page = await self.browser.new_page()
-            response = await page.goto(url, timeout=15000)
-            return response is not None and response.status == 200
-        except:
-            return False
+            async with self.pool.page() as page:
+                response = await self.goto(page, url, timeout=15000)
+                if response is None:
+                    return result
+                return ProbeResult.landed(url, response.status, page.url)
+        except Exception:
+            return result
+
+    async def check_url_once(self, url: str) -> ProbeResult:
+        """``check_url``, checked at most once per URL per run.
+
+        Only conclusive results are kept; a timeout or block is retried by
+        the next caller. A page found through a redirect is also remembered
+        under the URL it resolved to.
+        """
+        result = await self.flights.run(
+            ("exists", url),
+            lambda: self.check_url(url),
+            keep=lambda result: result.conclusive,
+        )
+        resolved_url = result.resolved_url
+        if result.exists and resolved_url != url:
+            self.flights.remember(
+                ("exists", resolved_url),
+                ProbeResult(url=resolved_url, status=200, final_url=resolved_url),
+            )
+        return result
+
+    def candidate_order(self, kind: str | None, urls: list[str | None]) -> list[int]:
+        """Order candidate slots using the pattern cache, if enabled."""
+        if kind and self.patterns:
+            return self.patterns.order(kind, urls)
+        return [i for i, url in enumerate(urls) if url]
+
+    def record_pattern(self, kind: str | None, slot: int, url: str, ok: bool, resolved_url: str | None = None):
+        """Record a pattern outcome in the pattern cache, if enabled."""
+        if kind and self.patterns:
+            self.patterns.record(kind, slot, url, ok, resolved_url)
+
+    async def first_existing_url(self, urls: list[str], kind: str | None = None) -> str | None:
+        """Probe candidate URLs concurrently and return the first hit in priority order.
+
+        All candidates are fired at once (the per-host limiter still paces them).
+        As soon as the highest-priority outstanding candidate exists, the
+        remaining probes are cancelled. When ``kind`` is given, the pattern
+        cache decides the priority order and records hits and definite misses;
+        inconclusive checks (timeouts, blocks, server errors) aren't recorded.
+
+        The hit is returned as the URL it resolved to after redirects, so
+        candidates that redirect to the same page (e.g. men's and women's
+        URLs of a combined tennis program) share later checks and fetches.
+        """
+        slots = self.candidate_order(kind, urls)
+        tasks = [asyncio.create_task(self.check_url_once(urls[slot])) for slot in slots]
+        try:
+            for slot, task in zip(slots, tasks):
+                result = await task
+                if result.conclusive:
+                    self.record_pattern(kind, slot, urls[slot], result.exists, result.resolved_url)
+                if result.exists:
+                    return result.resolved_url
+            return None
         finally:
-            if page:
-                await page.close()
-
-    def get_tennis_sport_paths(self, gender: Gender) -> list[str]:
-        """Get common sport path patterns for tennis."""
-        if gender == Gender.MEN:
-            return [
-                "/sports/mens-tennis",
-                "/sports/m-tennis",
-                "/sports/mten",     # Kentucky, some SEC sites
-                "/sport/m-tennis",  # Arkansas, Auburn, etc.
-                "/m-tennis",
-            ]
-        else:
-            return [
-                "/sports/womens-tennis",
-                "/sports/w-tennis",
-                "/sports/wten",     # Kentucky, some SEC sites
-                "/sport/w-tennis",  # Arkansas, Auburn, etc.
-                "/w-tennis",
-            ]
-
-    async def find_tennis_page(self, athletics_url: str, gender: Gender) -> str | None:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def find_tennis_page(
+        self,
+        athletics_url: str,
+        gender: Gender,
+        adapter: SiteAdapter = DEFAULT_ADAPTER,
+    ) -> str | None:
         """Find the tennis team page URL."""
         base = athletics_url.rstrip("/")
+        return await self.first_existing_url(
+            [f"{base}{path}" for path in adapter.tennis_paths(gender)],
+            kind="sport",
+        )
 
-        for path in self.get_tennis_sport_paths(gender):
-            url = f"{base}{path}"
-            if await self.check_url_exists(url):
-                return url
-
-        return None
-
-    async def find_coaches_url(self, tennis_url: str) -> str | None:
+    async def find_coaches_url(self, tennis_url: str, adapter: SiteAdapter = DEFAULT_ADAPTER) -> str | None:
         """Find the coaches page URL."""
         base_url = tennis_url.rstrip("/")
+        return await self.first_existing_url(
+            [f"{base_url}{pattern}" for pattern in adapter.coaches_paths],
+            kind="coaches",
+        )
 
-        for pattern in ["/coaches", "/staff", "/roster/coaches", "/roster/#coaches"]:
-            url = f"{base_url}{pattern}"
-            if await self.check_url_exists(url):
-                return url
-
-        return None
-
-    async def scrape_roster_coaches_section(self, tennis_url: str) -> tuple[Coach | None, list[Coach]]:
+    async def scrape_roster_coaches_section(
+        self,
+        tennis_url: str,
+        gender: Gender,
+        adapter: SiteAdapter = DEFAULT_ADAPTER,
+    ) -> tuple[CoachRecord | None, list[CoachRecord]]:
         """Scrape coaches from roster page with #coaches section or coach tables."""
-        # Build list of potential roster URLs to try
-        roster_urls = [f"{tennis_url.rstrip('/')}/roster/"]
-
-        # Try alternate URL patterns
-        # Arkansas uses /sport/ instead of /sports/
-        if "/sports/" in tennis_url:
-            roster_urls.append(tennis_url.replace("/sports/", "/sport/").rstrip('/') + "/roster/")
-
-        # Kentucky uses mten/wten instead of mens-tennis/womens-tennis
-        if "mens-tennis" in tennis_url:
-            roster_urls.append(tennis_url.replace("mens-tennis", "mten").rstrip('/') + "/roster/")
-        elif "womens-tennis" in tennis_url:
-            roster_urls.append(tennis_url.replace("womens-tennis", "wten").rstrip('/') + "/roster/")
+        # Slots are fixed so the pattern cache can carry a winner over to the
+        # other gender; None marks a pattern that doesn't apply to this URL.
+        roster_urls = adapter.roster_urls(tennis_url, gender)
 
-        page: Page | None = None
         try:
-            page = await self.browser.new_page()
-
             html = None
-            # Try each roster URL until we find one with coach data
-            for roster_url in roster_urls:
-                try:
-                    await page.goto(roster_url, timeout=30000)
-                    await asyncio.sleep(2)
+            slots = self.candidate_order("roster", roster_urls)
 
-                    # Look for coaches section by ID
-                    coaches_section = await page.query_selector("#coaches")
-                    if coaches_section:
-                        html = await coaches_section.inner_html()
-                        break
+            # The cache holds the coach section already extracted from a roster page
+            for slot in slots:
+                html = await self.cached_html(roster_urls[slot], "roster")
+                if html:
+                    break
 
-                    # Fallback: Check for coach table on roster page (Kentucky-style)
-                    full_html = await page.content()
-                    if "head coach" in full_html.lower():
-                        html = full_html
-                        break
-                except:
-                    continue
+            if not html:
+                html = await self.flights.run(
+                    ("roster", tuple(roster_urls[slot] for slot in slots)),
+                    lambda: self.render_roster_section(roster_urls, slots),
+                )
 
             if not html:
                 return None, []
 
-            # Parse the coaches section
-            soup = BeautifulSoup(f"<div>{html}</div>", "lxml")
-            coaches: list[Coach] = []
-            seen_names: set[str] = set()
-
-            # Look for table rows (Arkansas pattern)
-            rows = soup.find_all("tr")
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                if len(cells) < 2:
-                    continue
-
-                name = None
-                title = None
-                email = None
-
-                # First cell usually has name with link
-                name_cell = cells[0]
-                name_link = name_cell.find("a")
-                if name_link:
-                    name = name_link.get_text(strip=True)
-                else:
-                    name = name_cell.get_text(strip=True)
-
-                if not name or not looks_like_person_name(name):
-                    continue
-
-                # Second cell usually has title
-                if len(cells) >= 2:
-                    title = cells[1].get_text(strip=True)
-
-                # Look for email in the row
-                mailto = row.find("a", href=re.compile(r"^mailto:", re.I))
-                if mailto:
-                    email = extract_email_from_mailto(mailto["href"])
-
-                if name not in seen_names:
-                    seen_names.add(name)
-                    coaches.append(Coach(name=name, title=title, email=email, phone=None))
-
-            # Separate head coach from assistants
-            head_coach = None
-            assistants = []
-
-            for coach in coaches:
-                is_head = coach.title and (
-                    "head coach" in coach.title.lower()
-                    and "assistant" not in coach.title.lower()
-                    and "associate" not in coach.title.lower()
-                )
-                if is_head and not head_coach:
-                    head_coach = coach
-                else:
-                    assistants.append(coach)
-
-            return head_coach, assistants
+            return await self.parse_off_loop(parse_roster_coaches_plain, html, self.parser.name)
 
         except Exception as e:
             print(f"  Error fetching roster coaches: {e}")
             return None, []
-        finally:
-            if page:
-                await page.close()
-
-    def parse_coaches_from_html(self, html: str, base_url: str) -> tuple[Coach | None, list[Coach]]:
-        """Parse coach information from rendered HTML."""
-        soup = BeautifulSoup(html, "lxml")
-        coaches: list[Coach] = []
-        seen_names: set[str] = set()
-
-        # Strategy 1: Parse table rows (common on newer Sidearm sites)
-        # Look for tables or table-like structures with coach data
-        tables = soup.find_all("table")
-        for table in tables:
-            rows = table.find_all("tr")
-            for row in rows:
-                cells = row.find_all(["td", "th"])
-                if len(cells) >= 2:
-                    coach = self._extract_coach_from_row(cells)
-                    if coach and coach.name not in seen_names:
-                        seen_names.add(coach.name)
-                        coaches.append(coach)
-
-        # Strategy 2: Look for coach cards (common Sidearm patterns)
-        if not coaches:
-            coach_cards = soup.select(
-                ".sidearm-coaches-coach, "
-                "[class*='coach-card'], "
-                "[class*='staff-card'], "
-                "[class*='person-card'], "
-                "article[class*='coach'], "
-                "li[class*='coach']"
-            )
 
-            for card in coach_cards:
-                coach = self._extract_coach_from_card(card)
-                if coach and coach.name not in seen_names:
-                    seen_names.add(coach.name)
-                    coaches.append(coach)
-
-        # Strategy 3: Look for staff links and extract info
-        if not coaches:
-            staff_links = soup.find_all("a", href=re.compile(r"/staff/[a-zA-Z0-9-]+", re.I))
-            for link in staff_links[:15]:
-                name = link.get_text(strip=True)
-                if looks_like_person_name(name) and name not in seen_names:
-                    seen_names.add(name)
-
-                    parent = link.find_parent(["div", "li", "article", "section", "tr"])
-                    email = None
-                    title = None
-                    phone = None
-
-                    if parent:
-                        mailto = parent.find("a", href=re.compile(r"^mailto:", re.I))
-                        if mailto:
-                            email = extract_email_from_mailto(mailto["href"])
-
-                        tel = parent.find("a", href=re.compile(r"^tel:", re.I))
-                        if tel:
-                            phone = extract_phone_from_tel(tel["href"])
-
-                        # Look for title
-                        parent_text = parent.get_text()
-                        for pattern in ["Head Coach", "Assistant Coach", "Associate Head Coach", "Volunteer"]:
-                            if pattern.lower() in parent_text.lower():
-                                title = pattern
-                                break
-
-                    coaches.append(Coach(name=name, title=title, email=email, phone=phone))
-
-        # Strategy 4: Match emails to names via context text
-        if not coaches:
-            mailto_links = soup.find_all("a", href=re.compile(r"^mailto:", re.I))
-
-            for mailto in mailto_links[:15]:
-                email = extract_email_from_mailto(mailto["href"])
-                if not email:
-                    continue
+    async def render_roster_section(self, roster_urls: list[str | None], slots: list[int]) -> str | None:
+        """Render roster candidates in order and return the first coach section found."""
+        async with self.pool.page() as page:
+            # Try each roster URL until we find one with coach data
+            for slot in slots:
+                roster_url = roster_urls[slot]
+                html = None
+                try:
+                    response = await self.goto(page, roster_url)
+                    await wait_until_ready(page)
 
-                # Get surrounding context - walk up to find a container
-                parent = mailto.find_parent(["div", "li", "article", "tr", "section"])
-                if not parent:
+                    # Look for coaches section by ID
+                    coaches_section = await page.query_selector("#coaches")
+                    if coaches_section:
+                        html = await coaches_section.inner_html()
+                    else:
+                        # Fallback: Check for coach table on roster page (Kentucky-style)
+                        full_html = await page.content()
+                        if "head coach" in full_html.lower():
+                            html = full_html
+
+                    # A page that loaded without a coach section is a definite
+                    # miss; server errors and blocked loads prove nothing
+                    loaded = response is not None and response.status < 500
+                    if html or (loaded and response.status not in BLOCKED_STATUSES):
+                        self.record_pattern("roster", slot, roster_url, bool(html))
+                    if html:
+                        if response is not None and response.status == 200:
+                            self.cache_html(roster_url, "roster", html, response)
+                        return html
+                except:
                     continue
+        return None
 
-                parent_text = parent.get_text(separator=" ", strip=True)
-
-                # Try to find name and title in the text
-                name, title = self._extract_name_title_from_text(parent_text)
-
-                if name and name not in seen_names:
-                    seen_names.add(name)
-                    coaches.append(Coach(name=name, title=title, email=email, phone=None))
-
-        # Separate head coach from assistants
-        head_coach = None
-        assistants = []
-
-        for coach in coaches:
-            is_head = coach.title and (
-                "head coach" in coach.title.lower()
-                and "assistant" not in coach.title.lower()
-                and "associate" not in coach.title.lower()
-            )
-            if is_head and not head_coach:
-                head_coach = coach
-            else:
-                assistants.append(coach)
-
-        return head_coach, assistants
-
-    def _extract_coach_from_row(self, cells) -> Coach | None:
-        """Extract coach info from a table row."""
-        if len(cells) < 2:
-            return None
-
-        name = None
-        title = None
-        email = None
-        phone = None
-
-        for cell in cells:
-            text = cell.get_text(strip=True)
-
-            # Check for email link
-            mailto = cell.find("a", href=re.compile(r"^mailto:", re.I))
-            if mailto:
-                email = extract_email_from_mailto(mailto["href"])
-                continue
-
-            # Check for phone
-            tel = cell.find("a", href=re.compile(r"^tel:", re.I))
-            if tel:
-                phone = extract_phone_from_tel(tel["href"])
-                continue
-
-            # Check if it looks like a name first (before title check)
-            if looks_like_person_name(text) and not name:
-                name = text
-                continue
-
-            # Check if it's a title - must contain space and coaching keyword
-            # Avoid matching social media handles like "coachjamiehunt"
-            if " " in text and any(t in text.lower() for t in ["coach", "director", "coordinator"]):
-                title = text
-                continue
-
-        if not name:
-            return None
-
-        return Coach(name=name, title=title, email=email, phone=phone)
-
-    def _extract_name_title_from_text(self, text: str) -> tuple[str | None, str | None]:
-        """Extract name and title from a text block."""
-        # Common patterns: "John Smith Head Coach" or "Head Coach John Smith"
-        title_patterns = [
-            r"(Head Coach)",
-            r"(Associate Head Coach)",
-            r"(Assistant Coach)",
-            r"(Volunteer Assistant)",
-            r"(Director of Tennis)",
-            r"(Strength and Conditioning Coach[^,]*)",
-        ]
-
-        title = None
-        for pattern in title_patterns:
-            match = re.search(pattern, text, re.I)
-            if match:
-                title = match.group(1)
-                break
-
-        # Try to find a name (2+ capitalized words in sequence)
-        name_match = re.search(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b", text)
-        name = None
-        if name_match:
-            potential_name = name_match.group(1)
-            # Make sure it's not just the title
-            if title and potential_name.lower() == title.lower():
-                # Try to find another name
-                remaining = text.replace(potential_name, "", 1)
-                name_match = re.search(r"\b([A-Z][a-z]+(?:\s+[A-Z][a-z]+)+)\b", remaining)
-                if name_match:
-                    name = name_match.group(1)
-            else:
-                name = potential_name
-
-        return name, title
-
-    def _extract_coach_from_card(self, card) -> Coach | None:
-        """Extract coach info from a card element."""
-        # Find name
-        name = None
-        name_selectors = [
-            ".sidearm-coaches-coach-name",
-            "[class*='name']",
-            "h2", "h3", "h4",
-            "a[href*='/staff/']",
-        ]
-
-        for selector in name_selectors:
-            elem = card.select_one(selector)
-            if elem:
-                text = elem.get_text(strip=True)
-                if looks_like_person_name(text):
-                    name = text
-                    break
-
-        if not name:
-            return None
-
-        # Find title
-        title = None
-        title_selectors = [
-            ".sidearm-coaches-coach-title",
-            "[class*='title']",
-            "[class*='position']",
-        ]
-
-        for selector in title_selectors:
-            elem = card.select_one(selector)
-            if elem:
-                text = elem.get_text(strip=True)
-                if "coach" in text.lower() or "director" in text.lower():
-                    title = text
-                    break
-
-        if not title:
-            # Look in card text for coach keywords
-            card_text = card.get_text()
-            for pattern in [r"(Head Coach)", r"(Assistant Coach)", r"(Associate Head Coach)"]:
-                match = re.search(pattern, card_text, re.I)
-                if match:
-                    title = match.group(1)
-                    break
-
-        # Find email
-        email = None
-        mailto = card.find("a", href=re.compile(r"^mailto:", re.I))
-        if mailto:
-            email = extract_email_from_mailto(mailto["href"])
-
-        # Find phone
-        phone = None
-        tel = card.find("a", href=re.compile(r"^tel:", re.I))
-        if tel:
-            phone = extract_phone_from_tel(tel["href"])
-
-        return Coach(name=name, title=title, email=email, phone=phone)
+    def parse_coaches_from_html(self, html: str, base_url: str) -> tuple[CoachRecord | None, list[CoachRecord]]:
+        """Parse coach information from rendered HTML."""
+        return self.parser.parse_coaches(html)
+
+    async def run_off_loop(self, func, *args):
+        """Run a ``*_plain`` parser in the parse pool.
+
+        Only the HTML string goes to the worker and only plain data comes
+        back, so the event loop keeps driving navigations meanwhile.
+        """
+        if self.parse_pool is None:
+            return func(*args)
+        return await asyncio.get_running_loop().run_in_executor(self.parse_pool, func, *args)
+
+    async def parse_off_loop(self, func, html: str, *args) -> tuple[CoachRecord | None, list[CoachRecord]]:
+        """Run a ``*_plain`` coach parser in the parse pool and rebuild the coach records.
+
+        Identical HTML is parsed once per run. The shared result is plain
+        data, so each caller still gets its own records.
+        """
+        plain = await self.flights.run(
+            (func.__name__, fingerprint_fragment(html), *args),
+            lambda: self.run_off_loop(func, html, *args),
+            keep=True,
+        )
+        return coaches_from_plain(plain)
 
-    async def scrape_coaches_page(self, coaches_url: str) -> tuple[Coach | None, list[Coach]]:
-        """Scrape coach information using headless browser."""
+    async def scrape_coaches_page(
+        self,
+        coaches_url: str,
+        previous: ProgramRecord | None = None,
+        wait_for: str | None = None,
+        tier: str | None = None,
+    ) -> tuple[CoachRecord | None, list[CoachRecord], str | None]:
+        """Scrape coach information, static HTML first and the browser if needed.
+
+        The page is first fetched over plain HTTP and parsed as served. It is
+        escalated to a headless render when that finds no head coach or the
+        page has no mailto links, which usually means the coach list is
+        built by JavaScript. The static result is kept unless the render
+        finds a head coach it lacked or more coaches, so a failed or thinner
+        render never loses it.
+
+        The tier whose result is returned is recorded per domain when it has
+        a head coach, and later runs go straight to it: domains that needed
+        the browser skip the static fetch, and on domains recorded as static
+        (or platforms whose adapter ``tier`` is ``STATIC_TIER``) a static
+        head coach alone is final, so Playwright is skipped whenever the
+        static parse finds one.
+
+        Both tiers return a fingerprint of the coach-candidate nodes. When
+        ``previous`` was extracted from an identical fragment its coaches are
+        reused without parsing the page again.
+        """
+        static_result = None
+        recorded_tier = self.fetch_tier(coaches_url)
+        if recorded_tier != BROWSER_TIER:
+            html = await self.fetch_static(coaches_url)
+            if html:
+                fingerprint = await self.run_off_loop(fingerprint_static_page, html)
+                head_coach, assistants = await self.parse_unless_unchanged(html, fingerprint, previous)
+                static_result = head_coach, assistants, fingerprint
+                known_static = STATIC_TIER in (tier, recorded_tier)
+                if head_coach and (known_static or "mailto:" in html.lower()):
+                    self.record_tier(coaches_url, STATIC_TIER)
+                    return static_result
+
+        rendered_result = None, [], None
         html = await self.fetch_with_js(
             coaches_url,
-            wait_for="a[href*='mailto:'], [class*='coach'], [class*='staff']"
+            wait_for=wait_for,
+            fragment=True,
         )
+        if html:
+            fingerprint = fingerprint_fragment(html)
+            head_coach, assistants = await self.parse_unless_unchanged(html, fingerprint, previous)
+            rendered_result = head_coach, assistants, fingerprint
 
-        if not html:
-            return None, []
-
-        return self.parse_coaches_from_html(html, coaches_url)
+        if static_result and not renders_more(rendered_result, static_result):
+            if static_result[0]:
+                self.record_tier(coaches_url, STATIC_TIER)
+            return static_result
 
-    async def scrape_stanford_staff_directory(self, gender: Gender) -> tuple[Coach | None, list[Coach]]:
-        """Special handler for Stanford's centralized staff directory."""
-        sport_filter = "men's tennis" if gender == Gender.MEN else "women's tennis"
-        url = "https://gostanford.com/staff-directory"
+        if rendered_result[0]:
+            self.record_tier(coaches_url, BROWSER_TIER)
+        return rendered_result
 
-        html = await self.fetch_with_js(url)
+    async def parse_unless_unchanged(
+        self,
+        html: str,
+        fingerprint: str,
+        previous: ProgramRecord | None,
+    ) -> tuple[CoachRecord | None, list[CoachRecord]]:
+        """Coaches from ``previous`` if its fingerprint matches, else parsed from ``html``."""
+        if previous is not None and previous.coaches_fingerprint == fingerprint:
+            self.unchanged_pages += 1
+            return previous.head_coach, list(previous.assistant_coaches)
+        return await self.parse_off_loop(parse_coaches_plain, html, self.parser.name)
+
+    async def department_directory(self, url: str) -> DepartmentDirectory | None:
+        """Fetch and index a shared staff directory, once per run.
+
+        Concurrent callers (e.g. the men's and women's programs) await the
+        same load.
+        """
+        return await self.flights.run(("directory", url), lambda: self.load_department_directory(url), keep=True)
+
+    async def load_department_directory(self, url: str) -> DepartmentDirectory | None:
+        html = await self.fetch_with_js(url, fragment=True)
         if not html:
-            return None, []
-
-        soup = BeautifulSoup(html, "lxml")
-        coaches: list[Coach] = []
-        seen_names: set[str] = set()
-
-        # Stanford has table rows with staff info
-        # Format: Name | Title | Email | Phone
-        rows = soup.find_all("tr")
-
-        for row in rows:
-            cells = row.find_all(["td", "th"])
-            if len(cells) < 2:
-                continue
-
-            row_text = row.get_text().lower()
-
-            # Check if this row is for our tennis sport (exclusive, not shared with other sports)
-            # Look specifically for tennis coaching titles, not support staff
-            sport_specific = "men's tennis" if gender == Gender.MEN else "women's tennis"
-            is_tennis_coach = (
-                sport_specific in row_text and
-                # Must have director/coach in title context, not just in sport list
-                (
-                    f"director of {sport_specific}" in row_text or
-                    f"director • {sport_specific}" in row_text or
-                    f"{sport_specific} assistant coach" in row_text or
-                    f"assistant {sport_specific} coach" in row_text or
-                    f"{sport_specific} coach" in row_text or
-                    "head coach" in row_text
-                )
-            )
-
-            # Also try Stanford's endowed position pattern
-            if not is_tennis_coach:
-                is_tennis_coach = (
-                    sport_specific in row_text and
-                    ("director" in row_text or "coach" in row_text) and
-                    ("taube" in row_text or "family" in row_text or "endowed" in row_text)
-                )
-
-            if not is_tennis_coach:
-                continue
-
-            # Extract name (usually first cell or first link)
-            name = None
-            name_link = row.find("a", href=re.compile(r"/staff/", re.I))
-            if name_link:
-                name = name_link.get_text(strip=True)
-            elif cells:
-                name = cells[0].get_text(strip=True)
-
-            if not name or name in seen_names or len(name) < 3:
-                continue
-
-            # Skip if name contains non-name words
-            name_lower = name.lower()
-            if any(skip in name_lower for skip in ["email", "phone", "office", "staff directory"]):
-                continue
-
-            seen_names.add(name)
-
-            # Extract title
-            title = None
-            for cell in cells[1:]:
-                cell_text = cell.get_text(strip=True)
-                if "director" in cell_text.lower() or "coach" in cell_text.lower():
-                    title = cell_text
-                    break
-
-            # Extract email
-            email = None
-            mailto = row.find("a", href=re.compile(r"^mailto:", re.I))
-            if mailto:
-                email = extract_email_from_mailto(mailto["href"])
-
-            # Determine if this is the head coach
-            # Stanford uses "Director of Men's/Women's Tennis" for head coach
-            is_head = title and (
-                "director of" in title.lower() and "tennis" in title.lower() and "assistant" not in title.lower()
-            )
-
-            coach = Coach(name=name, title=title, email=email, phone=None)
-
-            if is_head:
-                # Return immediately as head coach
-                assistants = [c for c in coaches]  # Previous coaches are assistants
-                return coach, assistants
+            return None
+        rows = await self.run_off_loop(index_directory_plain, html, self.parser.name)
+        return DepartmentDirectory.from_plain(url, rows)
 
-            coaches.append(coach)
+    async def scrape_department_directory(self, url: str, gender: Gender) -> tuple[CoachRecord | None, list[CoachRecord]]:
+        """Look up this program's coaches in a school-wide staff directory."""
+        directory = await self.department_directory(url)
+        if directory is None:
+            return None, []
+        return directory.coaches("men's tennis" if gender == Gender.MEN else "women's tennis")
 
-        # If no head coach found, first coach might be head
-        head_coach = None
-        assistants = coaches
+    async def scrape_roster_tab(self, tennis_url: str) -> tuple[CoachRecord | None, list[CoachRecord]]:
+        """Scrape a roster page that keeps coaches behind a Coaches tab (Virginia)."""
+        roster_url = f"{tennis_url.rstrip('/')}/roster/"
 
-        if coaches:
-            # The first tennis-specific staff member is likely the head coach
-            head_coach = coaches[0]
-            assistants = coaches[1:]
+        html = await self.cached_html(roster_url, "roster-tab")
+        if not html:
+            html = await self.flights.run(("roster-tab", roster_url), lambda: self.render_roster_tab(roster_url))
 
-        return head_coach, assistants
+        if not html:
+            return None, []
 
-    async def scrape_virginia_roster(self, tennis_url: str) -> tuple[Coach | None, list[Coach]]:
-        """Special handler for Virginia's roster page with coaches section."""
-        roster_url = f"{tennis_url.rstrip('/')}/roster/"
+        return await self.parse_off_loop(parse_coaches_plain, html, self.parser.name)
 
-        page: Page | None = None
+    async def render_roster_tab(self, roster_url: str) -> str | None:
+        """Render a roster page with the coaches tab opened."""
         try:
-            page = await self.browser.new_page()
-            await page.goto(roster_url, timeout=30000)
-            await asyncio.sleep(2)
+            async with self.pool.page() as page:
+                response = await self.goto(page, roster_url)
+                await wait_until_ready(page)
+
+                # Click on coaches tab if it exists
+                coaches_tab = await page.query_selector("a[href*='#coaches'], button:has-text('Coaches')")
+                if coaches_tab:
+                    await coaches_tab.click()
+                    # The tab may fetch its content or just reveal what's in the DOM
+                    await wait_until_ready(page, timeout=3000)
+
+                html = await page.content()
+                if response is not None and response.status == 200:
+                    self.cache_html(roster_url, "roster-tab", html, response)
+                return html
+        except Exception as e:
+            print(f"  Error fetching roster tab: {e}")
+            return None
 
-            # Click on coaches tab if it exists
-            coaches_tab = await page.query_selector("a[href*='#coaches'], button:has-text('Coaches')")
-            if coaches_tab:
-                await coaches_tab.click()
-                await asyncio.sleep(1)
+    async def extract_coaches_page(
+        self,
+        adapter: SiteAdapter,
+        tennis_url: str | None,
+        gender: Gender,
+        previous: ProgramRecord | None,
+    ) -> tuple[CoachRecord | None, list[CoachRecord], str | None]:
+        """Coaches page, then the roster page's coach section."""
+        if not tennis_url:
+            return None, [], None
+
+        head_coach, assistants, fingerprint = None, [], None
+        coaches_url = await self.find_coaches_url(tennis_url, adapter)
+        if coaches_url:
+            head_coach, assistants, fingerprint = await self.scrape_coaches_page(
+                coaches_url, previous, adapter.wait_for, adapter.fetch_tier
+            )
 
-            html = await page.content()
-        except Exception as e:
-            print(f"  Error fetching Virginia roster: {e}")
-            return None, []
-        finally:
-            if page:
-                await page.close()
+        # Fallback: Try roster page with #coaches section (Arkansas, Auburn, LSU, etc.)
+        if not head_coach and not assistants and adapter.roster_fallback:
+            head_coach, assistants = await self.scrape_roster_coaches_section(tennis_url, gender, adapter)
+            fingerprint = None
 
-        if not html:
-            return None, []
+        return head_coach, assistants, fingerprint
 
-        return self.parse_coaches_from_html(html, roster_url)
+    async def extract_roster_tab(
+        self,
+        adapter: SiteAdapter,
+        tennis_url: str | None,
+        gender: Gender,
+        previous: ProgramRecord | None,
+    ) -> tuple[CoachRecord | None, list[CoachRecord], str | None]:
+        """Coaches tab on the roster page, then the coaches page."""
+        if not tennis_url:
+            return None, [], None
+
+        head_coach, assistants = await self.scrape_roster_tab(tennis_url)
+        if head_coach or assistants:
+            return head_coach, assistants, None
+
+        coaches_url = await self.find_coaches_url(tennis_url, adapter)
+        if coaches_url:
+            return await self.scrape_coaches_page(
+                coaches_url, previous, adapter.wait_for, adapter.fetch_tier
+            )
+        return None, [], None
 
-    def get_site_type(self, athletics_url: str) -> str:
-        """Determine site type for special handling."""
-        url_lower = athletics_url.lower()
-        if "gostanford.com" in url_lower:
-            return "stanford"
-        elif "virginiasports.com" in url_lower:
-            return "virginia"
-        return "standard"
+    async def extract_directory(
+        self,
+        adapter: SiteAdapter,
+        tennis_url: str | None,
+        gender: Gender,
+        previous: ProgramRecord | None,
+    ) -> tuple[CoachRecord | None, list[CoachRecord], str | None]:
+        """School-wide staff directory."""
+        head_coach, assistants = await self.scrape_department_directory(adapter.directory_url, gender)
+        return head_coach, assistants, None
 
     async def scrape_program(
         self,
@@ -672,39 +659,25 @@ class TennisScraper:
         athletics_url: str,
         division: Division,
         gender: Gender,
-    ) -> TennisProgram:
-        """Scrape a complete tennis program."""
-        tennis_url = await self.find_tennis_page(athletics_url, gender)
-
-        head_coach = None
-        assistants = []
-
-        site_type = self.get_site_type(athletics_url)
-
-        if site_type == "stanford":
-            # Stanford uses centralized staff directory
-            head_coach, assistants = await self.scrape_stanford_staff_directory(gender)
-        elif site_type == "virginia" and tennis_url:
-            # Virginia has coaches on roster page
-            head_coach, assistants = await self.scrape_virginia_roster(tennis_url)
-            # Fallback to standard if no results
-            if not head_coach and not assistants:
-                coaches_url = await self.find_coaches_url(tennis_url)
-                if coaches_url:
-                    head_coach, assistants = await self.scrape_coaches_page(coaches_url)
-        elif tennis_url:
-            # Standard approach
-            coaches_url = await self.find_coaches_url(tennis_url)
-            if coaches_url:
-                head_coach, assistants = await self.scrape_coaches_page(coaches_url)
-
-            # Fallback: Try roster page with #coaches section (Arkansas, Auburn, LSU, etc.)
-            if not head_coach and not assistants:
-                head_coach, assistants = await self.scrape_roster_coaches_section(tennis_url)
+        previous: ProgramRecord | None = None,
+    ) -> ProgramRecord:
+        """Scrape a complete tennis program.
+
+        The site adapter registered for the athletics domain, or else for
+        the platform it runs on, decides which URLs to try and how coaches
+        are extracted. ``previous`` is this
+        program from an earlier run; its coaches are reused if the coaches
+        page fingerprint hasn't changed.
+        """
+        adapter = self.adapters.for_url(athletics_url, await self.site_platform(athletics_url))
+        tennis_url = await self.find_tennis_page(athletics_url, gender, adapter)
+
+        extract = getattr(self, f"extract_{adapter.strategy}")
+        head_coach, assistants, fingerprint = await extract(adapter, tennis_url, gender, previous)
 
         team_name = f"{'Men' if gender == Gender.MEN else 'Women'}'s Tennis"
 
-        return TennisProgram(
+        return ProgramRecord(
             university=university,
             state=state,
             division=division,
@@ -714,4 +687,5 @@ class TennisScraper:
             assistant_coaches=assistants,
             athletics_url=athletics_url,
             tennis_page_url=tennis_url,
+            coaches_fingerprint=fingerprint,
         )
@@ -0,0 +1,69 @@
+"""Run-scoped coalescing of identical fetches and parses."""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable
+
+
+@dataclass
+class Flight:
+    task: asyncio.Future
+    waiters: int = 0
+
+
+class SingleFlight:
+    """Share one in-flight call per key among all callers.
+
+    The first ``run`` for a key starts ``factory()``; callers arriving while
+    it runs await the same task. With ``keep`` the result is also handed to
+    every later caller for the rest of the run (cheap results such as URL
+    checks and parsed coaches); otherwise the key is released once the call
+    finishes, and HTML caching serves repeats. ``keep`` may also be a
+    predicate on the result, to keep only results worth trusting for the
+    whole run. Failed calls are always released so they can be retried.
+
+    A caller being cancelled doesn't cancel the shared call while others
+    still wait on it; the call is only cancelled once its last waiter is.
+    """
+
+    def __init__(self):
+        self.flights: dict[Hashable, Flight] = {}
+        # Calls answered by an existing flight instead of starting one
+        self.hits = 0
+
+    async def run(
+        self,
+        key: Hashable,
+        factory: Callable[[], Awaitable[Any]],
+        keep: bool | Callable[[Any], bool] = False,
+    ) -> Any:
+        flight = self.flights.get(key)
+        if flight is None:
+            flight = self.flights[key] = Flight(asyncio.create_task(factory()))
+            flight.task.add_done_callback(lambda task: self.finish(key, flight, keep))
+        else:
+            self.hits += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def remember(self, key: Hashable, value: Any):
+        """Answer later ``run`` calls for ``key`` with ``value``, unless the key is already in flight."""
+        if key not in self.flights:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self.flights[key] = Flight(future)
+
+    def finish(self, key: Hashable, flight: Flight, keep: bool | Callable[[Any], bool]):
+        failed = flight.task.cancelled() or flight.task.exception() is not None
+        if not failed and callable(keep):
+            keep = keep(flight.task.result())
+        if (failed or not keep) and self.flights.get(key) is flight:
+            del self.flights[key]
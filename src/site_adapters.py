@@ -0,0 +1,160 @@
+"""Registry of per-site scraping adapters, matched by domain or platform."""
+
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
+from .models import Gender
+from .platforms import STATIC_TIER
+
+
+# Candidate paths are (men's, women's) pairs so the same slot means the same
+# pattern for both genders, which is what the pattern cache keys winners on.
+GenderedPath = tuple[str, str]
+
+SPORT_PATHS: tuple[GenderedPath, ...] = (
+    ("/sports/mens-tennis", "/sports/womens-tennis"),
+    ("/sports/m-tennis", "/sports/w-tennis"),
+    ("/sports/mten", "/sports/wten"),        # Kentucky, some SEC sites
+    ("/sport/m-tennis", "/sport/w-tennis"),  # Arkansas, Auburn, etc.
+    ("/m-tennis", "/w-tennis"),
+)
+
+COACHES_PATHS = ("/coaches", "/staff", "/roster/coaches", "/roster/#coaches")
+
+# Alternate roster URLs derived from the tennis page URL, as (old, new)
+# substring rewrites for men's and women's pages
+ROSTER_REWRITES: tuple[tuple[GenderedPath, GenderedPath], ...] = (
+    # Arkansas uses /sport/ instead of /sports/
+    (("/sports/", "/sport/"), ("/sports/", "/sport/")),
+    # Kentucky uses mten/wten instead of mens-tennis/womens-tennis
+    (("mens-tennis", "mten"), ("womens-tennis", "wten")),
+)
+
+
+@dataclass(frozen=True)
+class SiteAdapter:
+    """How to find and extract coaches on one site or platform.
+
+    ``strategy`` names the extraction path (``TennisScraper.extract_<strategy>``):
+      - "coaches_page": render the coaches page, falling back to the roster
+        page's coach section when ``roster_fallback`` is set,
+      - "roster_tab": open the Coaches tab on the roster page, falling back
+        to the coaches page,
+      - "directory": look coaches up in the school-wide staff directory at
+        ``directory_url``.
+
+    ``fetch_tier`` is the tier the site's coaches pages are known to work
+    with. ``STATIC_TIER`` means they are server-rendered: a head coach in the
+    plain HTTP fetch is final, even without mailto links, and Playwright is
+    only used when the static parse finds none. None leaves it to the tier
+    recorded per domain.
+    """
+
+    name: str
+    strategy: str = "coaches_page"
+    sport_paths: tuple[GenderedPath, ...] = SPORT_PATHS
+    coaches_paths: tuple[str, ...] = COACHES_PATHS
+    roster_rewrites: tuple[tuple[GenderedPath, GenderedPath], ...] = ROSTER_REWRITES
+    roster_fallback: bool = True
+    # Selector that signals the coaches page has rendered; None uses the
+    # content-scoped COACH_MARKERS
+    wait_for: str | None = None
+    directory_url: str | None = None
+    fetch_tier: str | None = None
+
+    def tennis_paths(self, gender: Gender) -> list[str]:
+        side = 0 if gender == Gender.MEN else 1
+        return [pair[side] for pair in self.sport_paths]
+
+    def roster_urls(self, tennis_url: str, gender: Gender) -> list[str | None]:
+        """Roster URL candidates, one fixed slot per pattern; None where a rewrite doesn't apply."""
+        base = tennis_url.rstrip("/")
+        urls: list[str | None] = [f"{base}/roster/"]
+        side = 0 if gender == Gender.MEN else 1
+        for rewrite in self.roster_rewrites:
+            old, new = rewrite[side]
+            urls.append(f"{base.replace(old, new)}/roster/" if old in base else None)
+        return urls
+
+
+# Platforms serve many schools with the same URL layout and markup. Sidearm
+# and PrestoSports render coaches pages server-side.
+SIDEARM = SiteAdapter(name="sidearm", fetch_tier=STATIC_TIER)
+PRESTO_SPORTS = SiteAdapter(
+    name="prestosports",
+    fetch_tier=STATIC_TIER,
+    sport_paths=(
+        ("/sports/mten", "/sports/wten"),
+        ("/sports/mten/index", "/sports/wten/index"),
+    ),
+    coaches_paths=("/coaches/index", "/coaches"),
+    roster_rewrites=(),
+)
+
+DEFAULT_ADAPTER = SiteAdapter(name="default")
+
+
+def normalize_domain(url: str) -> str:
+    """Lowercased host without a leading ``www.``."""
+    host = urlsplit(url).netloc.lower() if "//" in url else url.lower()
+    return host.removeprefix("www.")
+
+
+class AdapterRegistry:
+    """Adapters indexed by domain and by platform name for O(1) lookup."""
+
+    def __init__(self):
+        self.by_domain: dict[str, SiteAdapter] = {}
+        self.by_platform: dict[str, SiteAdapter] = {}
+
+    def register_domain(self, domain: str, adapter: SiteAdapter):
+        self.by_domain[normalize_domain(domain)] = adapter
+
+    def register_platform(self, platform: str, adapter: SiteAdapter):
+        self.by_platform[platform] = adapter
+
+    def for_url(self, url: str, platform: str | None = None) -> SiteAdapter:
+        """The domain's own adapter, else its platform's, else the default."""
+        adapter = self.by_domain.get(normalize_domain(url))
+        if adapter is None and platform:
+            adapter = self.by_platform.get(platform)
+        return adapter or DEFAULT_ADAPTER
+
+
+def observed_first(observed: GenderedPath) -> tuple[GenderedPath, ...]:
+    """``SPORT_PATHS`` with a site's known pair tried before the rest."""
+    return (observed,) + tuple(pair for pair in SPORT_PATHS if pair != observed)
+
+
+def default_registry() -> AdapterRegistry:
+    registry = AdapterRegistry()
+    registry.register_platform("sidearm", SIDEARM)
+    registry.register_platform("prestosports", PRESTO_SPORTS)
+
+    # Stanford lists coaches in its athletics-wide staff directory
+    registry.register_domain("gostanford.com", SiteAdapter(
+        name="stanford",
+        strategy="directory",
+        directory_url="https://gostanford.com/staff-directory",
+    ))
+    # Virginia keeps coaches behind a tab on the roster page
+    registry.register_domain("virginiasports.com", SiteAdapter(name="virginia", strategy="roster_tab"))
+    # Observed paths go first; the defaults still follow in case a site moves.
+    # Kentucky's men's page is the default /sports/mens-tennis but the women's
+    # is /sports/wten, so only the women's side of the first and /sports/mten
+    # slots is swapped and every other slot keeps its default place
+    registry.register_domain("ukathletics.com", SiteAdapter(
+        name="kentucky",
+        sport_paths=(
+            ("/sports/mens-tennis", "/sports/wten"),
+            ("/sports/m-tennis", "/sports/w-tennis"),
+            ("/sports/mten", "/sports/womens-tennis"),
+            ("/sport/m-tennis", "/sport/w-tennis"),
+            ("/m-tennis", "/w-tennis"),
+        ),
+    ))
+    registry.register_domain("arkansasrazorbacks.com", SiteAdapter(
+        name="arkansas",
+        sport_paths=observed_first(("/sports/m-tennis", "/sports/w-tennis")),
+    ))
+    return registry
@@ -0,0 +1,258 @@
+"""Persistent SQLite store of scraped programs and their coaches."""
+
+import sqlite3
+from datetime import datetime
+from pathlib import Path
+from typing import Iterator
+
+from rich.console import Console
+from rich.table import Table
+
+from .models import CoachRecord, Division, Gender, ProgramRecord
+
+
+console = Console()
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS programs (
+    id INTEGER PRIMARY KEY,
+    university TEXT NOT NULL,
+    gender TEXT NOT NULL,
+    state TEXT NOT NULL,
+    division TEXT NOT NULL,
+    team_name TEXT,
+    athletics_url TEXT NOT NULL,
+    tennis_page_url TEXT,
+    coaches_fingerprint TEXT,
+    scraped_at TEXT NOT NULL,
+    UNIQUE (university, gender)
+);
+CREATE TABLE IF NOT EXISTS coaches (
+    program_id INTEGER NOT NULL REFERENCES programs (id) ON DELETE CASCADE,
+    position INTEGER NOT NULL,
+    role TEXT NOT NULL,
+    name TEXT NOT NULL,
+    title TEXT,
+    email TEXT COLLATE NOCASE,
+    phone TEXT,
+    PRIMARY KEY (program_id, position)
+);
+-- UNIQUE (university, gender) also serves lookups by university
+CREATE INDEX IF NOT EXISTS programs_state ON programs (state);
+CREATE INDEX IF NOT EXISTS programs_division ON programs (division);
+CREATE INDEX IF NOT EXISTS programs_gender ON programs (gender);
+CREATE INDEX IF NOT EXISTS coaches_email ON coaches (email);
+"""
+
+PROGRAM_COLUMNS = (
+    "id, university, gender, state, division, team_name, "
+    "athletics_url, tennis_page_url, coaches_fingerprint, scraped_at"
+)
+
+
+class ProgramStore:
+    """Programs keyed by (university, gender), with one row per coach.
+
+    ``upsert`` replaces a program and its coaches in a single transaction, so
+    the batch scraper can write each program as soon as it completes.
+    ``query`` filters on the indexed columns in SQL and yields programs one
+    at a time instead of loading the whole dataset.
+    """
+
+    def __init__(self, path: Path = Path("data/programs.sqlite")):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(path)
+        self.conn.execute("PRAGMA foreign_keys = ON")
+        self.conn.executescript(SCHEMA)
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def upsert(self, program: ProgramRecord):
+        """Insert or replace a program and its coaches."""
+        with self.conn:
+            program_id = self.conn.execute(
+                "INSERT INTO programs (university, gender, state, division, team_name, "
+                "athletics_url, tennis_page_url, coaches_fingerprint, scraped_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (university, gender) DO UPDATE SET "
+                "state = excluded.state, division = excluded.division, "
+                "team_name = excluded.team_name, athletics_url = excluded.athletics_url, "
+                "tennis_page_url = excluded.tennis_page_url, "
+                "coaches_fingerprint = excluded.coaches_fingerprint, scraped_at = excluded.scraped_at "
+                "RETURNING id",
+                (
+                    program.university,
+                    program.gender.value,
+                    program.state,
+                    program.division.value,
+                    program.team_name,
+                    program.athletics_url,
+                    program.tennis_page_url,
+                    program.coaches_fingerprint,
+                    program.scraped_at.isoformat(),
+                ),
+            ).fetchone()[0]
+
+            coaches = [("head", program.head_coach)] if program.head_coach else []
+            coaches += [("assistant", c) for c in program.assistant_coaches]
+            self.conn.execute("DELETE FROM coaches WHERE program_id = ?", (program_id,))
+            self.conn.executemany(
+                "INSERT INTO coaches (program_id, position, role, name, title, email, phone) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [
+                    (program_id, position, role, c.name, c.title, c.email, c.phone)
+                    for position, (role, c) in enumerate(coaches)
+                ],
+            )
+
+    def load(self, row: tuple) -> ProgramRecord:
+        """Build a program from a ``PROGRAM_COLUMNS`` row plus its coaches."""
+        (program_id, university, gender, state, division, team_name,
+         athletics_url, tennis_page_url, fingerprint, scraped_at) = row
+
+        head_coach = None
+        assistants = []
+        for role, name, title, email, phone in self.conn.execute(
+            "SELECT role, name, title, email, phone FROM coaches WHERE program_id = ? ORDER BY position",
+            (program_id,),
+        ):
+            coach = CoachRecord(name=name, title=title, email=email, phone=phone)
+            if role == "head":
+                head_coach = coach
+            else:
+                assistants.append(coach)
+
+        return ProgramRecord(
+            university=university,
+            state=state,
+            division=Division(division),
+            gender=Gender(gender),
+            team_name=team_name,
+            head_coach=head_coach,
+            assistant_coaches=assistants,
+            athletics_url=athletics_url,
+            tennis_page_url=tennis_page_url,
+            coaches_fingerprint=fingerprint,
+            scraped_at=datetime.fromisoformat(scraped_at),
+        )
+
+    def get(self, university: str, gender: Gender) -> ProgramRecord | None:
+        row = self.conn.execute(
+            f"SELECT {PROGRAM_COLUMNS} FROM programs WHERE university = ? AND gender = ?",
+            (university, gender.value),
+        ).fetchone()
+        return self.load(row) if row else None
+
+    def filters(
+        self,
+        university: str | None = None,
+        state: str | None = None,
+        division: Division | None = None,
+        gender: Gender | None = None,
+        coach_email: str | None = None,
+        no_head_email: bool = False,
+    ) -> tuple[str, list]:
+        """WHERE clause and parameters for ``query``/``count``."""
+        clauses = []
+        params: list = []
+        if university:
+            clauses.append("university = ?")
+            params.append(university)
+        if state:
+            clauses.append("state = ?")
+            params.append(state)
+        if division:
+            clauses.append("division = ?")
+            params.append(division.value)
+        if gender:
+            clauses.append("gender = ?")
+            params.append(gender.value)
+        if coach_email:
+            clauses.append("id IN (SELECT program_id FROM coaches WHERE email = ?)")
+            params.append(coach_email)
+        if no_head_email:
+            clauses.append(
+                "NOT EXISTS (SELECT 1 FROM coaches WHERE program_id = programs.id "
+                "AND role = 'head' AND email IS NOT NULL)"
+            )
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        return where, params
+
+    def query(self, limit: int | None = None, **filters) -> Iterator[ProgramRecord]:
+        """Programs matching the filters, in (university, gender) order."""
+        where, params = self.filters(**filters)
+        sql = f"SELECT {PROGRAM_COLUMNS} FROM programs{where} ORDER BY university, gender"
+        if limit:
+            sql += " LIMIT ?"
+            params.append(limit)
+        for row in self.conn.execute(sql, params):
+            yield self.load(row)
+
+    def count(self, **filters) -> int:
+        where, params = self.filters(**filters)
+        return self.conn.execute(f"SELECT COUNT(*) FROM programs{where}", params).fetchone()[0]
+
+
+def display_programs(programs: Iterator[ProgramRecord]):
+    """Show queried programs with their head coach."""
+    table = Table(title="Stored programs")
+    table.add_column("University", style="cyan")
+    table.add_column("Gender")
+    table.add_column("Division")
+    table.add_column("State")
+    table.add_column("Head Coach", style="green")
+    table.add_column("Email")
+    table.add_column("Assistants")
+
+    for p in programs:
+        table.add_row(
+            p.university,
+            p.gender.value,
+            p.division.value,
+            p.state,
+            p.head_coach.name if p.head_coach else "-",
+            (p.head_coach.email if p.head_coach else None) or "-",
+            str(len(p.assistant_coaches)),
+        )
+
+    console.print(table)
+
+
+def main():
+    """Query the program store."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Query stored tennis programs")
+    parser.add_argument("--store", type=Path, default=Path("data/programs.sqlite"))
+    parser.add_argument("--university", help="Exact university name")
+    parser.add_argument("--state", help="State, e.g. Texas")
+    parser.add_argument("--division", choices=[d.value for d in Division])
+    parser.add_argument("--gender", choices=[g.value for g in Gender])
+    parser.add_argument("--email", help="Programs with a coach using this email")
+    parser.add_argument("--no-head-email", action="store_true", help="Programs without a head coach email")
+    parser.add_argument("--limit", type=int, help="Show at most this many programs")
+    parser.add_argument("--count", action="store_true", help="Only print the number of matches")
+    args = parser.parse_args()
+
+    store = ProgramStore(args.store)
+    filters = dict(
+        university=args.university,
+        state=args.state,
+        division=Division(args.division) if args.division else None,
+        gender=Gender(args.gender) if args.gender else None,
+        coach_email=args.email,
+        no_head_email=args.no_head_email,
+    )
+    try:
+        if args.count:
+            console.print(store.count(**filters))
+        else:
+            display_programs(store.query(limit=args.limit, **filters))
+    finally:
+        store.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""Readiness-driven waiting for rendered pages."""
+
+from playwright.async_api import Page, TimeoutError as PlaywrightTimeoutError
+
+
+# Elements that only exist once the coach data itself has rendered: coach
+# cards, content inside the #coaches roster section, and contact links inside
+# staff tables. Plain mailto links aren't enough, since footers carry them
+# from the first paint.
+COACH_MARKERS = (
+    ".sidearm-coaches-coach, [class*='coach-card'], [class*='staff-card'], "
+    "#coaches *, table a[href^='mailto:'], table a[href*='/staff/']"
+)
+
+# Resolves once the DOM has been quiet for settleMs after the selector first
+# matched (true), or for quietMs without it ever matching (false), or at the
+# hard timeout. The settle period lets a list that is still being appended to
+# finish rendering. Runs entirely in the page so there is no polling over the
+# Playwright pipe.
+READY_JS = """
+([selector, settleMs, quietMs, timeoutMs]) => new Promise(resolve => {
+    const matches = () => selector !== null && document.querySelector(selector) !== null;
+    let matched = matches();
+
+    let quietTimer;
+    const done = () => {
+        observer.disconnect();
+        clearTimeout(quietTimer);
+        clearTimeout(hardTimer);
+        resolve(matched);
+    };
+    const arm = () => {
+        clearTimeout(quietTimer);
+        quietTimer = setTimeout(done, matched ? settleMs : quietMs);
+    };
+    const observer = new MutationObserver(() => {
+        if (!matched) matched = matches();
+        arm();
+    });
+    observer.observe(document.documentElement, {childList: true, subtree: true, attributes: true});
+    const hardTimer = setTimeout(() => {
+        matched = matched || matches();
+        done();
+    }, timeoutMs);
+    arm();
+})
+"""
+
+MATCHES_JS = "selector => document.querySelector(selector) !== null"
+
+
+async def wait_until_ready(
+    page: Page,
+    markers: str | None = COACH_MARKERS,
+    timeout: int = 5000,
+    quiet_ms: int = 500,
+    settle_ms: int = 300,
+) -> bool:
+    """Wait until ``markers`` match and the DOM then settles, up to ``timeout`` ms.
+
+    A marker match alone can come while a list is still being filled in, so
+    the DOM must also stay quiet for ``settle_ms`` afterwards. If no marker
+    shows up before the DOM goes quiet for ``quiet_ms``, the coach data may
+    still be on its way over XHR, so also wait for the network to go idle
+    and check again. Pass ``markers=None`` to only wait for the DOM to
+    settle (e.g. after clicking a tab). Returns True if a marker matched.
+    """
+    try:
+        if await page.evaluate(READY_JS, [markers, settle_ms, quiet_ms, timeout]):
+            return True
+        if markers is None:
+            return False
+        try:
+            await page.wait_for_load_state("networkidle", timeout=timeout)
+        except PlaywrightTimeoutError:
+            pass
+        return await page.evaluate(MATCHES_JS, markers)
+    except Exception:
+        # Navigation mid-wait or a closed page; let the caller read what's there
+        return False
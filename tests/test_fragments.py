@@ -0,0 +1,37 @@
+"""Static pages are fingerprinted on their coach nodes, not the whole page."""
+
+from pathlib import Path
+
+from src.fragments import coach_fragment_from_html, fingerprint_static_page
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+
+def fixture(name: str) -> str:
+    return (FIXTURES / name).read_text()
+
+
+def test_fingerprint_ignores_changes_outside_coach_nodes():
+    html = fixture("coach_cards.html")
+    reloaded = html.replace("</body>", "<script>var served = 1734550000;</script></body>")
+
+    assert fingerprint_static_page(reloaded) == fingerprint_static_page(html)
+
+
+def test_fingerprint_changes_with_coaches():
+    html = fixture("coach_cards.html")
+
+    assert fingerprint_static_page(html.replace("Sarah Jones", "Sara Jones")) != fingerprint_static_page(html)
+
+
+def test_fragment_keeps_outermost_nodes_in_document_order():
+    fragment = coach_fragment_from_html(
+        "<html><body><nav><a href='/news'>News</a></nav>"
+        "<div id='coaches'><div class='coach-card'><a href='mailto:a@school.edu'>A</a></div></div>"
+        "<table><tr><td><a href='/staff/b'>B</a></td></tr></table></body></html>"
+    )
+
+    assert fragment.count("coach-card") == 1
+    assert "/news" not in fragment
+    assert fragment.index("id=\"coaches\"") < fragment.index("<table>")
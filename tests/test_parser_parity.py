@@ -0,0 +1,99 @@
+"""The soup and lxml parser backends must extract identical coaches."""
+
+from pathlib import Path
+
+import pytest
+
+from src.directory import DepartmentDirectory, index_directory_plain
+from src.extraction import PARSER_BACKENDS, check_parity, coaches_to_plain, get_parser_backend
+
+
+FIXTURES = Path(__file__).parent / "fixtures"
+BACKENDS = sorted(PARSER_BACKENDS)
+
+
+def fixture(name: str) -> str:
+    return (FIXTURES / name).read_text()
+
+
+def parse_with_each(method: str, html: str) -> dict[str, tuple]:
+    return {
+        name: coaches_to_plain(getattr(get_parser_backend(name), method)(html))
+        for name in BACKENDS
+    }
+
+
+# One page per extraction strategy, with the head coach and number of
+# assistants that strategy should find
+COACH_PAGES = [
+    ("coaches_table.html", "John Smith", 2),      # strategy 1: table rows
+    ("coach_cards.html", "Sarah Jones", 3),       # strategy 2: coach cards
+    ("staff_links.html", "Anna Peterson", 2),     # strategy 3: /staff/ links
+    ("mailto_only.html", "Michael Brown", 2),     # strategy 4: text around mailto links
+]
+
+
+@pytest.mark.parametrize("page, head_coach, assistant_count", COACH_PAGES)
+def test_coach_pages_match(page, head_coach, assistant_count):
+    results = parse_with_each("parse_coaches", fixture(page))
+
+    reference = results["soup"]
+    for name, result in results.items():
+        assert result == reference, f"{name} differs from soup on {page}"
+
+    head, assistants = reference
+    assert head["name"] == head_coach
+    assert len(assistants) == assistant_count
+
+
+@pytest.mark.parametrize("page", [page for page, _, _ in COACH_PAGES])
+def test_check_parity_reports_no_mismatch(page):
+    assert check_parity(fixture(page), tuple(BACKENDS)) == {}
+
+
+# BeautifulSoup gives <template> content no text, so people hidden in one
+# must not be extracted by either backend
+TEMPLATE_PAGES = [
+    # Card whose whole contents are a template
+    '<html><body><div class="coach-card"><template><h3>Jane Doe</h3><p>Head Coach</p>'
+    '<a href="mailto:jdoe@school.edu">Email</a></template></div></body></html>',
+    # Card inside a template
+    '<html><body><div><template><div class="coach-card"><h3>Jane Doe</h3>'
+    '<p>Head Coach</p></div></template></div></body></html>',
+    # Staff link inside a template
+    '<html><body><ul><li class="coach"><template><a href="/staff/jane-doe">Jane Doe</a>'
+    ' Head Coach</template></li></ul></body></html>',
+]
+
+
+@pytest.mark.parametrize("html", TEMPLATE_PAGES)
+def test_template_content_is_ignored(html):
+    results = parse_with_each("parse_coaches", html)
+
+    assert results["lxml"] == results["soup"] == (None, [])
+
+
+def test_roster_section_matches():
+    results = parse_with_each("parse_roster_coaches", fixture("roster_coaches.html"))
+
+    assert results["lxml"] == results["soup"]
+    head, assistants = results["soup"]
+    assert head["name"] == "Lisa Grant"
+    assert head["email"] == "lgrant@school.edu"
+    assert [c["name"] for c in assistants] == ["Ben Ortiz"]
+
+
+def test_directory_index_matches():
+    html = fixture("staff_directory.html")
+    rows = {name: index_directory_plain(html, name) for name in BACKENDS}
+
+    # Row text feeds the sport grouping, so it must match exactly too
+    assert rows["lxml"] == rows["soup"]
+
+    directory = DepartmentDirectory.from_plain("https://school.edu/staff-directory", rows["soup"])
+    head, assistants = directory.coaches("men's tennis")
+    # Only staff listed before the director count as assistants
+    assert head.name == "Paul Martin"
+    assert assistants == []
+    head, assistants = directory.coaches("women's tennis")
+    assert head.name == "Nora Bell"
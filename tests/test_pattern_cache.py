@@ -0,0 +1,42 @@
+"""Pattern cache ordering and the redirect targets recorded with hits."""
+
+import sqlite3
+
+from src.pattern_cache import PatternCache
+
+
+def test_hit_keeps_where_it_landed(tmp_path):
+    cache = PatternCache(tmp_path / "patterns.sqlite")
+    cache.record("sport", 0, "https://school.edu/sports/mens-tennis", True, "https://school.edu/sports/tennis")
+    cache.record("sport", 1, "https://school.edu/sports/m-tennis", True, "https://school.edu/sports/m-tennis")
+
+    assert cache.resolved_url("https://school.edu/sports/mens-tennis") == "https://school.edu/sports/tennis"
+    # Not redirected
+    assert cache.resolved_url("https://school.edu/sports/m-tennis") is None
+
+
+def test_failed_patterns_are_tried_last(tmp_path):
+    cache = PatternCache(tmp_path / "patterns.sqlite")
+    urls = ["https://school.edu/a", "https://school.edu/b", "https://school.edu/c"]
+    cache.record("sport", 1, urls[1], False)
+    cache.record("sport", 2, urls[2], True)
+
+    assert cache.order("sport", urls) == [2, 0, 1]
+
+
+def test_adds_resolved_url_to_existing_cache(tmp_path):
+    path = tmp_path / "patterns.sqlite"
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE url_patterns (domain TEXT NOT NULL, kind TEXT NOT NULL, pattern TEXT NOT NULL, "
+        "slot INTEGER NOT NULL, ok INTEGER NOT NULL, checked_at REAL NOT NULL, "
+        "PRIMARY KEY (domain, kind, pattern))"
+    )
+    conn.execute("INSERT INTO url_patterns VALUES ('school.edu', 'sport', '/sports/mten', 0, 1, 0)")
+    conn.commit()
+    conn.close()
+
+    cache = PatternCache(path)
+
+    assert cache.lookup("https://school.edu/sports/mten") is True
+    assert cache.resolved_url("https://school.edu/sports/mten") is None
@@ -0,0 +1,46 @@
+"""Redirects that land somewhere other than the requested page are misses."""
+
+import pytest
+
+from src.prober import ProbeResult, is_soft_404
+
+
+@pytest.mark.parametrize("url, final_url", [
+    # Missing sport pages bounced to the home page or a section index
+    ("https://school.edu/sports/mens-tennis", "https://school.edu/"),
+    ("https://school.edu/sports/mens-tennis", "https://school.edu/sports"),
+    ("https://school.edu/sports/mens-tennis/coaches", "https://school.edu/sports/mens-tennis"),
+    # Unrelated landing page
+    ("https://school.edu/sports/mens-tennis", "https://school.edu/sports/football"),
+])
+def test_redirect_away_from_page_is_soft_404(url, final_url):
+    assert is_soft_404(url, final_url)
+
+
+@pytest.mark.parametrize("url, final_url", [
+    # Same path, e.g. a scheme or host redirect
+    ("http://school.edu/sports/mens-tennis", "https://www.school.edu/sports/mens-tennis/"),
+    # Spellings of the same page
+    ("https://school.edu/sports/m-tennis", "https://school.edu/sports/mens-tennis"),
+    ("https://school.edu/sports/mten", "https://school.edu/sports/mens-tennis"),
+    ("https://school.edu/sports/womens-tennis", "https://school.edu/sports/wten"),
+    ("https://school.edu/sports/mens-tennis", "https://school.edu/sports/tennis"),
+    # Deeper page under the requested one
+    ("https://school.edu/sports/mens-tennis", "https://school.edu/sports/mens-tennis/roster"),
+])
+def test_redirect_to_same_page_is_found(url, final_url):
+    assert not is_soft_404(url, final_url)
+
+
+def test_landed_on_home_page_is_missing():
+    result = ProbeResult.landed("https://school.edu/sports/mten/coaches", 200, "https://school.edu/")
+
+    assert not result.exists
+    assert result.missing
+
+
+def test_landed_on_alias_exists():
+    result = ProbeResult.landed("https://school.edu/sports/wten", 200, "https://school.edu/sports/womens-tennis")
+
+    assert result.exists
+    assert not result.missing
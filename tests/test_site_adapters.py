@@ -0,0 +1,26 @@
+"""Adapter candidate lists stay aligned with the default slot layout."""
+
+import pytest
+
+from src.models import Gender
+from src.site_adapters import SPORT_PATHS, default_registry
+
+
+REGISTRY = default_registry()
+ADAPTERS = list(REGISTRY.by_domain.values()) + list(REGISTRY.by_platform.values())
+
+
+@pytest.mark.parametrize("adapter", ADAPTERS, ids=lambda adapter: adapter.name)
+@pytest.mark.parametrize("gender", [Gender.MEN, Gender.WOMEN])
+def test_no_path_is_probed_twice(adapter, gender):
+    paths = adapter.tennis_paths(gender)
+
+    assert len(paths) == len(set(paths))
+
+
+def test_kentucky_keeps_default_slots():
+    kentucky = REGISTRY.for_url("https://ukathletics.com")
+
+    assert kentucky.tennis_paths(Gender.MEN) == [men for men, _ in SPORT_PATHS]
+    assert kentucky.tennis_paths(Gender.WOMEN)[0] == "/sports/wten"
+    assert sorted(kentucky.tennis_paths(Gender.WOMEN)) == sorted(women for _, women in SPORT_PATHS)